@@ -311,8 +311,12 @@ def main():
     # Sort by year, quarter, region, species
     df = df.sort_values(['year', 'quarter', 'region', 'species', 'product_type'])
 
-    # Save to CSV
+    # Save to CSV, plus a Parquet copy with the text columns dictionary-encoded
+    # for faster reloads
     df.to_csv(output_path, index=False)
+    df.astype({
+        col: 'category' for col in ['region', 'species', 'product_type', 'grade', 'unit']
+    }).to_parquet(output_path.with_suffix('.parquet'), index=False, compression='zstd', compression_level=3)
 
     console.print(f"\n[bold green]Successfully saved {len(df)} records to {output_path}[/bold green]\n")
 
@@ -2,13 +2,17 @@
 
 import re
 from pathlib import Path
-from bs4 import BeautifulSoup
 import pandas as pd
+from lxml import html as lxml_html
 from rich.console import Console
 from rich.table import Table
 
 console = Console()
 
+# SCFC pages are UTF-8. lxml only honours a <meta charset> and otherwise
+# assumes Latin-1 for bytes input, so the encoding is given explicitly
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
 
 def extract_year_quarter_from_filename(filename: str) -> tuple[int, int]:
     """Extract year and quarter from filename like 'sc_timber_2020_q1.html'."""
@@ -87,30 +91,34 @@ def parse_product_name(product_str: str) -> tuple[str, str]:
     return species, product_type
 
 
+def cell_texts(row: lxml_html.HtmlElement) -> list[str]:
+    """Text of each td/th cell in a table row, stripped piece by piece."""
+    return [
+        "".join(text.strip() for text in cell.xpath(".//text()"))
+        for cell in row.xpath(".//td | .//th")
+    ]
+
+
 def parse_html_file(html_file: Path) -> list[dict]:
     """Parse a single HTML file and extract stumpage prices."""
     records = []
 
-    with open(html_file, "r", encoding="utf-8") as file:
-        content = file.read()
-
-    soup = BeautifulSoup(content, "html.parser")
-    table = soup.find("table")
+    # The raw bytes go straight to lxml's C parser, decoded as UTF-8
+    tree = lxml_html.fromstring(html_file.read_bytes(), parser=_UTF8_HTML_PARSER)
+    tables = tree.xpath("//table")
 
-    if not table:
+    if not tables:
         console.print(f"[yellow]Warning: No table found in {html_file.name}[/yellow]")
         return records
 
-    rows = table.find_all("tr")
+    rows = tables[0].xpath(".//tr")
 
     if len(rows) < 2:
         console.print(f"[yellow]Warning: Not enough rows in {html_file.name}[/yellow]")
         return records
 
     # Parse header row to get quarter information
-    header_row = rows[0]
-    header_cells = header_row.find_all(["td", "th"])
-    header_text = [cell.get_text(strip=True) for cell in header_cells]
+    header_text = cell_texts(rows[0])
 
     # First column is "Product type", rest are quarters
     quarter_headers = header_text[1:]
@@ -127,11 +135,10 @@ def parse_html_file(html_file: Path) -> list[dict]:
 
     # Parse data rows
     for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
-        if len(cells) < 2:
+        cell_text = cell_texts(row)
+        if len(cell_text) < 2:
             continue
 
-        cell_text = [cell.get_text(strip=True) for cell in cells]
         product_name = cell_text[0]
         prices = cell_text[1:]
 
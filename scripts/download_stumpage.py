@@ -21,6 +21,7 @@ Options:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
@@ -148,6 +149,9 @@ SOURCES = {
 def download_source(source_name: str) -> dict:
     """Download data from a single source.
 
+    Only the download runs here, so sources can be fetched side by side;
+    parsing is left to parse_source.
+
     Args:
         source_name: Name of the source to download
 
@@ -165,19 +169,11 @@ def download_source(source_name: str) -> dict:
         with downloader_class() as downloader:
             files = downloader.download()
 
-            # Try to parse if the source supports it
-            parsed = {}
-            if hasattr(downloader, "parse"):
-                try:
-                    parsed = downloader.parse()
-                except Exception as e:
-                    console.print(f"[yellow]Parse warning:[/yellow] {e}")
-
             return {
                 "source": source_name,
                 "files_downloaded": len(files),
                 "files": [str(f) for f in files],
-                "parsed_tables": len(parsed) if parsed else 0,
+                "parsed_tables": 0,
             }
 
     except Exception as e:
@@ -185,6 +181,28 @@ def download_source(source_name: str) -> dict:
         return {"source": source_name, "error": str(e)}
 
 
+def parse_source(result: dict) -> None:
+    """Parse a downloaded source, recording the table count in its result.
+
+    Args:
+        result: Dictionary returned by download_source
+    """
+    if "error" in result:
+        return
+
+    downloader_class = SOURCES[result["source"]]["class"]
+
+    # Try to parse if the source supports it
+    with downloader_class() as downloader:
+        if hasattr(downloader, "parse"):
+            try:
+                parsed = downloader.parse()
+            except Exception as e:
+                console.print(f"[yellow]Parse warning:[/yellow] {e}")
+                return
+            result["parsed_tables"] = len(parsed) if parsed else 0
+
+
 def print_summary(results: list[dict]) -> None:
     """Print a summary of all downloads."""
     console.print("\n")
@@ -259,11 +277,16 @@ def main():
         style="blue",
     ))
 
-    # Download each source
-    results = []
-    for source_name in sources:
-        result = download_source(source_name)
-        results.append(result)
+    # Sources are served by different hosts, so download them side by side;
+    # map() keeps the results in the order requested
+    with ThreadPoolExecutor(max_workers=min(len(sources), 8)) as executor:
+        results = list(executor.map(download_source, sources))
+
+    # Parse one source at a time once every download has finished: several
+    # parsers start their own process pools, which must not be forked from
+    # a process with download threads still running
+    for result in results:
+        parse_source(result)
 
     # Print summary
     print_summary(results)
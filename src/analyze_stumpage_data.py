@@ -19,8 +19,14 @@ def load_data(csv_path: Path) -> pd.DataFrame:
         console.print("[yellow]Run parse_tn_bulletins.py first to generate data[/yellow]")
         return None
 
-    df = pd.read_csv(csv_path)
-    console.print(f"[green]Loaded {len(df)} records from {csv_path.name}[/green]\n")
+    # Prefer the typed Parquet copy written alongside the CSV, unless some
+    # other script has rewritten the CSV since
+    parquet_path = csv_path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        data_path, df = parquet_path, pd.read_parquet(parquet_path)
+    else:
+        data_path, df = csv_path, pd.read_csv(csv_path)
+    console.print(f"[green]Loaded {len(df)} records from {data_path.name}[/green]\n")
     return df
 
 
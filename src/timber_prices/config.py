@@ -1,5 +1,6 @@
 """Configuration settings for forest-rents package."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,7 +15,8 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    # Base paths
+    # Base paths. The directory properties create their directory on first
+    # access and cache the path, so later reads are plain attribute loads.
     project_root: Path = Field(
         default_factory=lambda: Path(__file__).parent.parent.parent
     )
@@ -24,28 +26,28 @@ class Settings(BaseSettings):
         """Base data directory."""
         return self.project_root / "data"
 
-    @property
+    @cached_property
     def raw_dir(self) -> Path:
         """Raw downloaded data."""
         path = self.data_dir / "raw"
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @property
+    @cached_property
     def processed_dir(self) -> Path:
         """Processed intermediate data."""
         path = self.data_dir / "processed"
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @property
+    @cached_property
     def output_dir(self) -> Path:
         """Final output data."""
         path = self.data_dir / "output"
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    @property
+    @cached_property
     def figures_dir(self) -> Path:
         """Generated figures."""
         path = self.project_root / "figures"
@@ -154,6 +156,7 @@ STUMPAGE_SOURCES = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings singleton."""
     return Settings()
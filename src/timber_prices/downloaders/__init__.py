@@ -1,37 +1,91 @@
-"""Data downloaders for stumpage price sources."""
-
-from timber_prices.downloaders.base import BaseDownloader
-from timber_prices.downloaders.usfs_pnw import USFSPNWDownloader
-from timber_prices.downloaders.nc_state import NCStateDownloader
-from timber_prices.downloaders.texas_am import TexasAMDownloader
-from timber_prices.downloaders.lake_states import (
-    MichiganDNRDownloader,
-    MinnesotaDNRDownloader,
-    WisconsinDNRDownloader,
-    LakeStatesDownloader,
-)
-from timber_prices.downloaders.northeast import (
-    NewYorkDECDownloader,
-    PennsylvaniaExtensionDownloader,
-    VermontFPRDownloader,
-    NortheastDownloader,
-)
-from timber_prices.downloaders.maine import MaineForestServiceDownloader
-from timber_prices.downloaders.arkansas import ArkansasExtensionDownloader
-from timber_prices.downloaders.mississippi import MississippiExtensionDownloader
-from timber_prices.downloaders.louisiana import LouisianaForestryDownloader
-from timber_prices.downloaders.alabama import AlabamaForestryDownloader
-from timber_prices.downloaders.georgia import (
-    GeorgiaDORDownloader,
-    UGAExtensionDownloader,
-    GeorgiaDownloader,
-)
-from timber_prices.downloaders.florida import FloridaIFASDownloader
-from timber_prices.downloaders.south_carolina import SouthCarolinaForestryDownloader
-from timber_prices.downloaders.west_virginia import WestVirginiaForestryDownloader
+"""Data downloaders for stumpage price sources.
+
+Downloader classes are imported on first access (PEP 562), so importing
+one source does not pull in every other source's parsing dependencies.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from timber_prices.downloaders.base import BaseDownloader, QuarterlyReportDownloader
+    from timber_prices.downloaders.usfs_pnw import USFSPNWDownloader
+    from timber_prices.downloaders.nc_state import NCStateDownloader
+    from timber_prices.downloaders.texas_am import TexasAMDownloader
+    from timber_prices.downloaders.lake_states import (
+        MichiganDNRDownloader,
+        MinnesotaDNRDownloader,
+        WisconsinDNRDownloader,
+        LakeStatesDownloader,
+    )
+    from timber_prices.downloaders.northeast import (
+        NewYorkDECDownloader,
+        PennsylvaniaExtensionDownloader,
+        VermontFPRDownloader,
+        NortheastDownloader,
+    )
+    from timber_prices.downloaders.maine import MaineForestServiceDownloader
+    from timber_prices.downloaders.arkansas import ArkansasExtensionDownloader
+    from timber_prices.downloaders.mississippi import MississippiExtensionDownloader
+    from timber_prices.downloaders.louisiana import LouisianaForestryDownloader
+    from timber_prices.downloaders.alabama import AlabamaForestryDownloader
+    from timber_prices.downloaders.georgia import (
+        GeorgiaDORDownloader,
+        UGAExtensionDownloader,
+        GeorgiaDownloader,
+    )
+    from timber_prices.downloaders.florida import FloridaIFASDownloader
+    from timber_prices.downloaders.south_carolina import SouthCarolinaForestryDownloader
+    from timber_prices.downloaders.west_virginia import WestVirginiaForestryDownloader
+
+# Exported name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "BaseDownloader": "base",
+    "QuarterlyReportDownloader": "base",
+    "USFSPNWDownloader": "usfs_pnw",
+    "NCStateDownloader": "nc_state",
+    "TexasAMDownloader": "texas_am",
+    "MichiganDNRDownloader": "lake_states",
+    "MinnesotaDNRDownloader": "lake_states",
+    "WisconsinDNRDownloader": "lake_states",
+    "LakeStatesDownloader": "lake_states",
+    "NewYorkDECDownloader": "northeast",
+    "PennsylvaniaExtensionDownloader": "northeast",
+    "VermontFPRDownloader": "northeast",
+    "NortheastDownloader": "northeast",
+    "MaineForestServiceDownloader": "maine",
+    "ArkansasExtensionDownloader": "arkansas",
+    "MississippiExtensionDownloader": "mississippi",
+    "LouisianaForestryDownloader": "louisiana",
+    "AlabamaForestryDownloader": "alabama",
+    "GeorgiaDORDownloader": "georgia",
+    "UGAExtensionDownloader": "georgia",
+    "GeorgiaDownloader": "georgia",
+    "FloridaIFASDownloader": "florida",
+    "SouthCarolinaForestryDownloader": "south_carolina",
+    "WestVirginiaForestryDownloader": "west_virginia",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a downloader class from its submodule on first access."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "BaseDownloader",
+    "QuarterlyReportDownloader",
     # Pacific Northwest
     "USFSPNWDownloader",
     # South
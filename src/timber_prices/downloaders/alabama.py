@@ -173,10 +173,12 @@ class AlabamaForestryDownloader(BaseDownloader):
         table.add_column("Status", style="yellow")
         table.add_column("Size", style="green")
 
+        pdf_files = {entry.name: entry for entry in self._scan_files("al_forest_resource_*.pdf")}
+
         for year in sorted(ANNUAL_REPORTS.keys(), reverse=True):
-            pdf_path = self.download_dir / f"al_forest_resource_{year}.pdf"
-            if pdf_path.exists():
-                size_kb = pdf_path.stat().st_size / 1024
+            entry = pdf_files.get(f"al_forest_resource_{year}.pdf")
+            if entry is not None:
+                size_kb = entry.stat().st_size / 1024
                 status = "[green]Downloaded[/green]"
                 size = f"{size_kb:.1f} KB"
             else:
@@ -188,7 +190,7 @@ class AlabamaForestryDownloader(BaseDownloader):
 
         # Count totals
         total_available = len(ANNUAL_REPORTS)
-        total_downloaded = len(list(self.download_dir.glob("al_forest_resource_*.pdf")))
+        total_downloaded = len(pdf_files)
         console.print(f"\n[dim]Total available: {total_available} annual reports[/dim]")
         console.print(f"[dim]Downloaded: {total_downloaded} reports[/dim]")
 
@@ -1,30 +1,314 @@
 """Base downloader class for stumpage price data sources."""
 
+import atexit
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from fnmatch import filter as fnmatch_filter
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.table import Table
 
 from timber_prices.config import get_settings
 
 console = Console()
 
+# HTTP/2 requires the optional ``h2`` package (``pip install httpx[http2]``).
+# Without it the client falls back to HTTP/1.1 with keep-alive.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Advertise compressed transfer encodings httpx can decode. Brotli is only
+# offered when a decoder (``brotli`` or ``brotlicffi``) is installed.
+ACCEPT_ENCODING = ", ".join(
+    ["gzip", "deflate"]
+    + (["br"] if any(importlib.util.find_spec(m) for m in ("brotli", "brotlicffi")) else [])
+)
+
+# Read/write granularity for streamed downloads. Writes this large bypass
+# the file object's own buffer, so each chunk is a single write() call.
+CHUNK_SIZE = 1 << 20
+
+
+# Download attempts per file, and the statuses worth retrying (rate
+# limiting and transient server or gateway errors)
+MAX_ATTEMPTS = 4
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(attempt: int, error: httpx.HTTPError) -> float:
+    """Seconds to wait before the next attempt.
+
+    Honours a Retry-After header (capped at a minute), otherwise backs off
+    exponentially from 0.5s with full jitter.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = error.response.headers.get("retry-after")
+        if retry_after:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                    seconds = (when - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    seconds = None
+            if seconds is not None:
+                return min(max(seconds, 0.0), 60.0)
+    return random.uniform(0, min(0.5 * 2 ** (attempt - 1), 8.0))
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve disk space for a file of known size in a single allocation."""
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        # Not supported on every filesystem (e.g. some network mounts)
+        pass
+
+
+class InvalidContentError(Exception):
+    """Raised when a server response is clearly not the expected file."""
+
+
+# Content-Type substrings accepted for PDF downloads. Some servers label
+# PDFs as generic binary, which looks_like_pdf then checks
+PDF_CONTENT_TYPES = ("pdf", "octet-stream")
+
+
+def looks_like_pdf(head: bytes) -> bool:
+    """Check the leading bytes of a response for the PDF signature."""
+    return b"%PDF" in head[:1024]
+
+
+# Rich allows one live display per console, so concurrent downloads (and
+# downloaders running side by side) share a single Progress instance
+_progress_lock = threading.Lock()
+_progress: Progress | None = None
+_progress_users = 0
+
+
+@contextmanager
+def shared_progress(enabled: bool = True) -> Iterator[Progress]:
+    """Yield the shared download Progress, starting it on first use.
+
+    Args:
+        enabled: If False, yield a disabled Progress that renders nothing
+    """
+    global _progress, _progress_users
+
+    if not enabled:
+        yield Progress(disable=True)
+        return
+
+    with _progress_lock:
+        if _progress is None:
+            _progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+            )
+            _progress.start()
+        _progress_users += 1
+        progress = _progress
+
+    try:
+        yield progress
+    finally:
+        with _progress_lock:
+            _progress_users -= 1
+            if _progress_users == 0:
+                _progress.stop()
+                _progress = None
+
+
+def meta_path(path: Path) -> Path:
+    """Sidecar file holding cache validators for a downloaded file."""
+    return path.with_name(f"{path.name}.meta.json")
+
+
+def read_meta(path: Path) -> dict:
+    """Load cache validators for a downloaded file, if any."""
+    try:
+        return json.loads(meta_path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def write_meta(path: Path, meta: dict) -> None:
+    """Record cache validators for a downloaded file.
+
+    Downloaders that fetch files by other means (e.g. curl) record at least
+    the url and size, so later runs can tell a complete copy from a
+    truncated one.
+    """
+    meta_path(path).write_text(json.dumps(meta, indent=2))
+
+
+def _discard_partial(part_path: Path) -> None:
+    """Remove an interrupted download and its resume metadata."""
+    part_path.unlink(missing_ok=True)
+    meta_path(part_path).unlink(missing_ok=True)
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stamp_path(source: Path) -> Path:
+    """Sidecar file recording the last parse of a source file."""
+    return source.with_name(f"{source.name}.parsed.json")
+
+
+def read_parse_stamp(source: Path) -> list[str] | None:
+    """Return the outputs recorded for a source file if it is unchanged.
+
+    Returns:
+        Output names saved by the last parse, or None if the source has
+        changed (or was never parsed)
+    """
+    try:
+        stamp = json.loads(_stamp_path(source).read_text())
+    except (OSError, ValueError):
+        return None
+    if stamp.get("sha256") != file_sha256(source):
+        return None
+    return stamp.get("outputs")
+
+
+def write_parse_stamp(source: Path, outputs: list[str]) -> None:
+    """Record the source file's hash and the outputs parsed from it."""
+    stamp = {"sha256": file_sha256(source), "outputs": outputs}
+    _stamp_path(source).write_text(json.dumps(stamp, indent=2))
+
+
+def extract_pdf_text(path: Path, cache_dir: Path) -> str:
+    """Extract a PDF's text layer, caching the result by content hash.
+
+    Uses pypdfium2, which reads the text layer directly and is much faster
+    than pdfplumber's layout analysis.
+
+    Args:
+        path: PDF file to extract
+        cache_dir: Directory holding cached ``<sha256>.txt`` extractions
+
+    Returns:
+        Text of all pages, separated by form feeds
+    """
+    cache_path = cache_dir / f"{file_sha256(path)}.txt"
+    if cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        pages = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+
+    text = "\f".join(pages)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(text, encoding="utf-8")
+    return text
+
+
+def write_csv(df, path: Path) -> None:
+    """Write a DataFrame to CSV using PyArrow's columnar writer.
+
+    Falls back to pandas for frames Arrow cannot convert, such as object
+    columns mixing numbers and text or duplicate column names.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError):
+        df.to_csv(path, index=False)
+        return
+    pacsv.write_csv(table, path)
+
+
+def write_parquet(df, path: Path) -> bool:
+    """Write a DataFrame to Snappy-compressed Parquet.
+
+    Returns:
+        True if written, False if Arrow could not convert the frame (column
+        types, or duplicate/non-string column names)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError):
+        return False
+    pq.write_table(table, path, compression="snappy")
+    return True
+
+
+@cache
+def _shared_client() -> httpx.Client:
+    """HTTP client shared by all downloaders, closed at interpreter exit.
+
+    One pool serves every source, so instances created side by side (or
+    one after another) reuse warm keep-alive connections.
+    """
+    client = httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        # Fail fast on unreachable hosts, but allow slow bodies
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=32,
+            keepalive_expiry=60.0,
+        ),
+        headers={
+            "User-Agent": "Mozilla/5.0 (timber-prices research project)",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        },
+    )
+    atexit.register(client.close)
+    return client
+
 
 class BaseDownloader(ABC):
     """Abstract base class for data downloaders."""
 
     def __init__(self):
         self.settings = get_settings()
-        self.client = httpx.Client(
-            timeout=60.0,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (timber-prices research project)"
-            },
-        )
+        self.client = _shared_client()
 
     @property
     @abstractmethod
@@ -38,51 +322,374 @@ class BaseDownloader(ABC):
         """Short identifier for the data source (used in directory names)."""
         pass
 
-    @property
+    @cached_property
     def download_dir(self) -> Path:
-        """Directory for this source's downloaded files."""
+        """Directory for this source's downloaded files, created on first use."""
         path = self.settings.raw_dir / self.source_id
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    def download_file(self, url: str, filename: str | None = None) -> Path:
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Directory for caches derived from the downloads, created on first use.
+
+        Kept under processed/ so the raw directory holds only downloaded files.
+        """
+        path = self.settings.processed_dir / self.source_id / "cache"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @cached_property
+    def _existing_files(self) -> frozenset[str]:
+        """Names of files in the download directory, from a single listing."""
+        with os.scandir(self.download_dir) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+
+    def _invalidate_existing_files(self) -> None:
+        """Drop the cached directory listing after files are written or removed."""
+        self.__dict__.pop("_existing_files", None)
+
+    def _list_files(self, pattern: str) -> list[Path]:
+        """Downloaded files matching a glob pattern, sorted by name."""
+        return [
+            self.download_dir / name
+            for name in sorted(fnmatch_filter(self._existing_files, pattern))
+        ]
+
+    def _scan_files(self, pattern: str) -> list[os.DirEntry]:
+        """Directory entries matching a glob pattern, sorted by name.
+
+        Use when file sizes are needed: each entry caches its own stat().
+        """
+        with os.scandir(self.download_dir) as entries:
+            matches = [
+                entry for entry in entries
+                if entry.is_file() and fnmatch_filter([entry.name], pattern)
+            ]
+        return sorted(matches, key=lambda entry: entry.name)
+
+    def download_file(
+        self,
+        url: str,
+        filename: str | None = None,
+        show_progress: bool = True,
+        min_size: int = 0,
+        validate: Callable[[bytes], bool] | None = None,
+        content_types: tuple[str, ...] = (),
+    ) -> Path:
         """Download a file from URL to the source's download directory.
 
         Args:
             url: URL to download from
             filename: Optional filename override. If None, extracted from URL.
+            show_progress: Whether to show a progress bar and status lines
+                for this file. Batch callers report progress themselves.
+            min_size: Reject responses whose Content-Length is below this many
+                bytes without reading the body (e.g. HTML error pages)
+            validate: Optional check on the first 1 KiB of the body; the
+                transfer is abandoned before anything is written if it fails
+            content_types: If given, reject responses whose Content-Type
+                contains none of these substrings (e.g. ``("pdf",)``)
 
         Returns:
             Path to the downloaded file
+
+        Raises:
+            InvalidContentError: If the declared body is smaller than min_size,
+                has an unexpected Content-Type, or fails validation
+            httpx.HTTPError: If the request still fails after retrying
         """
         if filename is None:
             filename = url.split("/")[-1].split("?")[0]
 
+        # Transient failures are retried with jittered exponential backoff.
+        # A transfer cut off mid-body leaves its .part file behind, so the
+        # next attempt resumes it where the server allows
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                return self._fetch(url, filename, show_progress, min_size, validate, content_types)
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                if attempt == MAX_ATTEMPTS or (
+                    isinstance(e, httpx.HTTPStatusError)
+                    and e.response.status_code not in RETRY_STATUSES
+                ):
+                    raise
+                delay = _retry_delay(attempt, e)
+                if show_progress:
+                    console.print(f"[yellow]Retrying {filename} in {delay:.1f}s:[/yellow] {e}")
+                time.sleep(delay)
+
+    def _fetch(
+        self,
+        url: str,
+        filename: str,
+        show_progress: bool,
+        min_size: int,
+        validate: Callable[[bytes], bool] | None,
+        content_types: tuple[str, ...],
+    ) -> Path:
+        """Make a single download attempt; see download_file."""
         dest_path = self.download_dir / filename
+        # Bodies are streamed to a .part file and renamed into place when
+        # complete, so an interrupted transfer never looks like a download
+        part_path = dest_path.with_name(f"{dest_path.name}.part")
 
-        console.print(f"[blue]Downloading:[/blue] {filename}")
+        # Revalidate against the server's validators from the last download
+        headers = {}
+        # A local copy with no sidecar at all (e.g. saved by hand or by an
+        # older version) can only be matched against the response's size
+        untracked = False
+        if dest_path.exists():
+            meta = read_meta(dest_path)
+            untracked = not meta
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            stat = dest_path.stat()
+            if not headers and (meta.get("sha256") or meta.get("size") == stat.st_size):
+                # No validators were recorded for this copy, but it is known
+                # to be complete; ask whether the server's file has changed
+                # since ours was written. A truncated or foreign copy is
+                # never revalidated by its mtime alone.
+                headers["If-Modified-Since"] = formatdate(stat.st_mtime, usegmt=True)
+
+        # Resume an interrupted transfer if the server said it could serve
+        # byte ranges of that same version (If-Range falls back to a full
+        # 200 response if the file has changed since)
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        part_validator = read_meta(part_path).get("if_range") if offset else None
+        if part_validator:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = part_validator
+            # Ranges of a compressed representation cannot be appended
+            headers["Accept-Encoding"] = "identity"
+
+        if show_progress:
+            console.print(f"[blue]Downloading:[/blue] {filename}")
+
+        with self.client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                _discard_partial(part_path)
+                if show_progress:
+                    console.print(f"[dim]Not modified:[/dim] {dest_path}")
+                return dest_path
+
+            if response.status_code == 416 and "Range" in headers:
+                # The saved part is no longer a valid prefix; start over
+                response.close()
+                _discard_partial(part_path)
+                return self._fetch(url, filename, show_progress, min_size, validate, content_types)
 
-        with self.client.stream("GET", url) as response:
             response.raise_for_status()
             total = int(response.headers.get("content-length", 0))
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                DownloadColumn(),
-                console=console,
-            ) as progress:
-                task = progress.add_task(f"[cyan]{filename}", total=total)
+            resumed = response.status_code == 206
+            if resumed:
+                if not response.headers.get("content-range", "").startswith(f"bytes {offset}-"):
+                    # Not the range that was asked for; start over
+                    response.close()
+                    _discard_partial(part_path)
+                    return self._fetch(url, filename, show_progress, min_size, validate, content_types)
+                total += offset
+            else:
+                offset = 0
+
+            # Without any record of the local copy, treat it as already
+            # downloaded if its size matches the declared body. Copies that
+            # were revalidated got a 200 because the server's file changed,
+            # so a matching size says nothing about them
+            if (
+                untracked
+                and "Range" not in headers
+                and dest_path.exists()
+                and "content-encoding" not in response.headers
+                and total == dest_path.stat().st_size > 0
+            ):
+                if show_progress:
+                    console.print(f"[dim]Up to date:[/dim] {dest_path}")
+                return dest_path
+
+            # Headers arrive before the body, so an undersized or mistyped
+            # response can be rejected without transferring it
+            content_type = response.headers.get("content-type", "").lower()
+            if 0 < total < min_size:
+                raise InvalidContentError(
+                    f"{filename}: server reported {total} bytes "
+                    f"({content_type or 'unknown type'})"
+                )
+            if content_types and content_type and not any(
+                expected in content_type for expected in content_types
+            ):
+                raise InvalidContentError(f"{filename}: unexpected type {content_type}")
 
-                with open(dest_path, "wb") as f:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                        progress.update(task, advance=len(chunk))
+            chunks = response.iter_bytes(chunk_size=CHUNK_SIZE)
+            if validate is not None and not resumed:
+                # Check the start of the body before touching the disk
+                head = next(chunks, b"")
+                if not validate(head[:1024]):
+                    raise InvalidContentError(
+                        f"{filename}: unexpected content ({content_type or 'unknown type'})"
+                    )
+                chunks = itertools.chain([head], chunks)
 
-        console.print(f"[green]Saved:[/green] {dest_path}")
+            # A fresh transfer can be resumed later only if the server serves
+            # byte ranges of an identified, uncompressed representation
+            etag = response.headers.get("etag")
+            # Weak ETags cannot be used in If-Range
+            if etag and not etag.startswith("W/"):
+                if_range = etag
+            else:
+                if_range = response.headers.get("last-modified")
+            resumable = (
+                not resumed
+                and if_range is not None
+                and response.headers.get("accept-ranges") == "bytes"
+                and "content-encoding" not in response.headers
+            )
+
+            with shared_progress(show_progress) as progress:
+                task = progress.add_task(
+                    f"[cyan]{filename}", total=total or None, completed=offset
+                )
+                digest = hashlib.sha256()
+
+                try:
+                    if resumed:
+                        # Hash the bytes already on disk, then append the rest
+                        with open(part_path, "rb") as f:
+                            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                                digest.update(chunk)
+                    elif resumable:
+                        meta_path(part_path).write_text(json.dumps({"if_range": if_range}))
+                    else:
+                        meta_path(part_path).unlink(missing_ok=True)
+
+                    with open(part_path, "ab" if resumed else "wb") as f:
+                        # A resumable .part file's size must track the bytes
+                        # actually written, so only preallocate the others
+                        if total > 0 and not (resumed or resumable):
+                            _preallocate(f.fileno(), total)
+
+                        for chunk in chunks:
+                            f.write(chunk)
+                            digest.update(chunk)
+                            progress.update(task, advance=len(chunk))
+
+                        # Drop any preallocated space the body did not fill
+                        # (Content-Length is the encoded size for gzip responses)
+                        f.truncate()
+                finally:
+                    progress.remove_task(task)
+
+            os.replace(part_path, dest_path)
+            meta_path(part_path).unlink(missing_ok=True)
+
+            meta = {
+                "url": url,
+                "etag": etag,
+                "last_modified": response.headers.get("last-modified"),
+                "sha256": digest.hexdigest(),
+            }
+            write_meta(dest_path, meta)
+            self._invalidate_existing_files()
+
+        if show_progress:
+            console.print(f"[green]Saved:[/green] {dest_path}")
         return dest_path
 
+    def _warm_up(self, url: httpx.URL | str) -> None:
+        """Open a pooled connection to url's host with a cheap HEAD request."""
+        try:
+            self.client.head(url, timeout=5.0)
+        except httpx.HTTPError:
+            # Only a warm-up; the real requests report their own errors
+            pass
+
+    def download_many(
+        self,
+        jobs: list[tuple[str, str]],
+        max_workers: int = 8,
+        min_size: int = 0,
+        validate: Callable[[bytes], bool] | None = None,
+        content_types: tuple[str, ...] = (),
+    ) -> list[Path | Exception]:
+        """Download several files concurrently over the shared client.
+
+        Args:
+            jobs: List of (url, filename) pairs
+            max_workers: Maximum number of downloads in flight at once
+            min_size: Passed through to download_file for every job
+            validate: Passed through to download_file for every job
+            content_types: Passed through to download_file for every job
+
+        Returns:
+            One entry per job, in input order: the downloaded path, or the
+            exception raised while downloading it
+        """
+        results: list[Path | Exception] = [None] * len(jobs)
+
+        # Over HTTP/2 concurrent requests to one host can share a connection,
+        # but only once it exists; otherwise every worker races to open its
+        # own. Open one per host first so the batch multiplexes over it
+        if HTTP2_AVAILABLE and len(jobs) > 1:
+            for origin in dict.fromkeys(httpx.URL(url).join("/") for url, _ in jobs):
+                self._warm_up(origin)
+
+        with (
+            shared_progress() as progress,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            task = progress.add_task(f"[cyan]{self.source_name}", total=len(jobs))
+            futures = {
+                executor.submit(
+                    self.download_file,
+                    url,
+                    filename,
+                    show_progress=False,
+                    min_size=min_size,
+                    validate=validate,
+                    content_types=content_types,
+                ): i
+                for i, (url, filename) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    results[futures[future]] = e
+                progress.update(task, advance=1)
+
+        return results
+
+    def extract_pdf_texts(self, paths: list[Path]) -> dict[Path, str]:
+        """Extract text from several PDFs in parallel, reusing cached text.
+
+        Args:
+            paths: PDF files to extract
+
+        Returns:
+            Mapping of path to extracted text for each PDF that could be read
+        """
+        cache_dir = self.cache_dir / "text_cache"
+        texts = {}
+        if not paths:
+            return texts
+
+        # pdfium keeps global state and is not thread-safe, so use processes
+        with ProcessPoolExecutor() as executor:
+            futures = {
+                executor.submit(extract_pdf_text, path, cache_dir): path for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    texts[path] = future.result()
+                except Exception as e:
+                    console.print(f"[yellow]Could not extract text from {path.name}:[/yellow] {e}")
+
+        return texts
+
     @abstractmethod
     def download(self) -> list[Path]:
         """Download all data files from this source.
@@ -105,4 +712,225 @@ class BaseDownloader(ABC):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.client.close()
+        # The client is shared with other downloaders and closed at exit
+        pass
+
+
+class QuarterlyReportDownloader(BaseDownloader):
+    """Base class for sources that publish one report file per quarter.
+
+    Subclasses describe their catalogue with class attributes and, if its
+    entries are not already URLs, override report_url. The defaults suit
+    PDF reports; HTML sources override the format and validation hooks.
+    The flattened report table is built once per class, when the subclass
+    is defined.
+    """
+
+    # {year: {quarter: report info}}, or {year: [quarters]} when the URL is
+    # derived from the year and quarter alone
+    quarterly_reports: ClassVar[dict[int, Any]]
+    # Local file name, formatted with year and quarter
+    filename_template: ClassVar[str]
+    # State name used in parse() messages, e.g. "Louisiana"
+    state_name: ClassVar[str]
+    # Banner line under the source name in download()
+    coverage: ClassVar[str]
+    # Description of the report contents printed by parse()
+    contents: ClassVar[str]
+
+    # Report format, as described by parse()
+    report_format: ClassVar[str] = "PDF"
+    report_kind: ClassVar[str] = "PDFs"
+    parse_note: ClassVar[str] = "PDF parsing requires pdfplumber or similar tools."
+    # Checks applied to every response before it is written
+    min_size: ClassVar[int] = 5 * 1024
+    content_types: ClassVar[tuple[str, ...]] = PDF_CONTENT_TYPES
+    validate_head: ClassVar[Callable[[bytes], bool] | None] = staticmethod(looks_like_pdf)
+    # Default number of years fetched by download_recent()
+    recent_years: ClassVar[int] = 5
+    # Number of years shown by get_summary() (None for all)
+    summary_years: ClassVar[int | None] = None
+
+    # Derived from quarterly_reports in __init_subclass__
+    _years_desc: ClassVar[tuple[int, ...]]
+    _all_reports: ClassVar[tuple[tuple[int, int, str, str], ...]]
+    _report_files: ClassVar[dict[str, tuple[int, int]]]
+    _summary_filenames: ClassVar[dict[tuple[int, int], str]]
+    _file_pattern: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        reports = cls.__dict__.get("quarterly_reports")
+        if reports is None:
+            return
+
+        # Years newest first, and a flat (year, quarter, url, local filename)
+        # table in that order
+        cls._years_desc = tuple(sorted(reports, reverse=True))
+        cls._all_reports = tuple(
+            (
+                year,
+                quarter,
+                cls.report_url(
+                    year,
+                    quarter,
+                    reports[year][quarter] if isinstance(reports[year], dict) else None,
+                ),
+                cls.filename_template.format(year=year, quarter=quarter),
+            )
+            for year in cls._years_desc
+            for quarter in sorted(reports[year])
+        )
+        cls._report_files = {
+            local_filename: (year, quarter) for year, quarter, _, local_filename in cls._all_reports
+        }
+        # Every cell of the summary table, including quarters with no report
+        cls._summary_filenames = {
+            (year, quarter): cls.filename_template.format(year=year, quarter=quarter)
+            for year in cls._years_desc
+            for quarter in (1, 2, 3, 4)
+        }
+        cls._file_pattern = cls.filename_template.format(year="*", quarter="*")
+
+    @classmethod
+    def report_url(cls, year: int, quarter: int, report_info: Any) -> str:
+        """Get the download URL for a catalogue entry (by default, the entry itself)."""
+        return report_info
+
+    def download(self, years: list[int] | None = None) -> list[Path]:
+        """Download quarterly reports.
+
+        Args:
+            years: Optional list of years to download. Defaults to all available.
+
+        Returns:
+            List of paths to downloaded report files
+        """
+        console.print(f"\n[bold blue]{'='*60}[/bold blue]")
+        console.print(f"[bold]{self.source_name}[/bold]")
+        console.print(f"[dim]{self.coverage}[/dim]")
+        console.print(f"[bold blue]{'='*60}[/bold blue]\n")
+
+        # Determine which years to download
+        if years is None:
+            wanted = set(self._years_desc)
+        else:
+            wanted = set()
+            for year in years:
+                if year in self.quarterly_reports:
+                    wanted.add(year)
+                else:
+                    console.print(f"[yellow]No reports available for {year}[/yellow]")
+
+        # Build the full job list up front, then fetch concurrently
+        quarters_wanted = []
+        jobs = []
+        for year, quarter, url, local_filename in self._all_reports:
+            if year not in wanted:
+                continue
+            quarters_wanted.append((year, quarter))
+            jobs.append((url, local_filename))
+
+        downloaded = []
+        failed = []
+
+        # Error pages are rejected by size, type or their first bytes before
+        # anything is written
+        results = self.download_many(
+            jobs,
+            min_size=self.min_size,
+            validate=self.validate_head,
+            content_types=self.content_types,
+        )
+        for (year, quarter), result in zip(quarters_wanted, results):
+            if isinstance(result, InvalidContentError):
+                console.print(
+                    f"[yellow]Invalid file for {year} Q{quarter} (not {self.report_format})[/yellow]"
+                )
+                failed.append((year, quarter))
+            elif isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {year} Q{quarter}:[/yellow] {result}")
+                failed.append((year, quarter))
+            else:
+                downloaded.append(result)
+
+        console.print(f"\n[bold green]Downloaded {len(downloaded)} quarterly reports[/bold green]")
+        if failed:
+            console.print(f"[yellow]Failed: {len(failed)} reports[/yellow]")
+
+        return downloaded
+
+    def download_recent(self, num_years: int | None = None) -> list[Path]:
+        """Download the most recent N years of reports.
+
+        Args:
+            num_years: Number of recent years to download. Defaults to
+                the class's recent_years.
+
+        Returns:
+            List of paths to downloaded files
+        """
+        if num_years is None:
+            num_years = self.recent_years
+        return self.download(years=list(self._years_desc[:num_years]))
+
+    def parse(self) -> dict[int, Any]:
+        """Catalogue the downloaded reports.
+
+        Note: Extracting prices from the reports needs format-specific tools.
+
+        Returns:
+            Dictionary with file metadata by year and quarter
+        """
+        console.print(f"\n[bold]{self.state_name} reports are {self.report_kind}.[/bold]")
+        console.print(f"[dim]{self.parse_note}[/dim]")
+        console.print(f"[dim]{self.contents}[/dim]\n")
+
+        # Walk the directory once; files outside the catalogue are ignored
+        results = {}
+        for entry in self._scan_files(self._file_pattern):
+            key = self._report_files.get(entry.name)
+            if key is None:
+                continue
+            year, quarter = key
+            results.setdefault(year, {})[f"Q{quarter}"] = {
+                "file": entry.path,
+                "status": "downloaded",
+                "format": self.report_format,
+                "size_kb": round(entry.stat().st_size / 1024, 1),
+            }
+
+        # Newest years first, as in the catalogue
+        return {year: results[year] for year in self._years_desc if year in results}
+
+    def get_summary(self) -> None:
+        """Print a year-by-quarter summary of downloaded reports."""
+        table = Table(title=self.source_name)
+        table.add_column("Year", style="cyan")
+        table.add_column("Q1", style="white")
+        table.add_column("Q2", style="white")
+        table.add_column("Q3", style="white")
+        table.add_column("Q4", style="white")
+
+        present = self._existing_files
+
+        for year in self._years_desc[: self.summary_years]:
+            row = [str(year)]
+            for quarter in (1, 2, 3, 4):
+                if self._summary_filenames[year, quarter] in present:
+                    row.append("[green]Yes[/green]")
+                elif quarter in self.quarterly_reports[year]:
+                    row.append("[dim]No[/dim]")
+                else:
+                    row.append("[dim]-[/dim]")
+            table.add_row(*row)
+
+        console.print(table)
+
+        # Count total available and downloaded
+        total_downloaded = sum(1 for name in present if name in self._report_files)
+        console.print(
+            f"\n[dim]Total available: {len(self._all_reports)} quarterly reports "
+            f"({len(self._years_desc)} years)[/dim]"
+        )
+        console.print(f"[dim]Downloaded: {total_downloaded} reports[/dim]")
@@ -11,14 +11,30 @@ Data sources:
 - https://dnr.wisconsin.gov/topic/forestlandowners/taxrates
 """
 
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 from rich.console import Console
 from rich.table import Table
 
-from timber_prices.downloaders.base import BaseDownloader
+from timber_prices.downloaders.base import (
+    PDF_CONTENT_TYPES,
+    BaseDownloader,
+    looks_like_pdf,
+    read_parse_stamp,
+    write_csv,
+    write_parquet,
+    write_parse_stamp,
+)
+
+# pandas and openpyxl are only needed to parse the Michigan workbook, so
+# they are imported there rather than for every Lake States download
+if TYPE_CHECKING:
+    import pandas as pd
 
 console = Console()
 
@@ -46,6 +62,12 @@ MN_REPORTS = {
     2007: "stumpage-review-report-2007.pdf",
 }
 
+# Resolved (year, url, local filename) for each report, built once at import
+_MN_TARGETS = tuple(
+    (year, f"{MN_BASE_URL}/{filename}", f"mn_stumpage_{year}.pdf")
+    for year, filename in MN_REPORTS.items()
+)
+
 # Wisconsin DNR URLs
 # FCL = Forest Crop Law, MFL = Managed Forest Law
 # Rates are 3-year weighted averages, updated annually (effective Nov 1 - Oct 31)
@@ -73,6 +95,68 @@ WI_STUMPAGE_FILES = {
     },
 }
 
+# Resolved (file id, url, local filename) for each rate sheet
+_WI_TARGETS = tuple(
+    (file_id, info["url"], f"wi_{file_id}.pdf")
+    for file_id, info in WI_STUMPAGE_FILES.items()
+)
+
+
+def _sheet_csv_name(sheet_name: str) -> str:
+    """CSV filename for a Michigan workbook sheet."""
+    return f"mi_{sheet_name.lower().replace(' ', '_')}.csv"
+
+
+def _normalize_header(header: tuple | None) -> list[str]:
+    """Name blank header cells and de-duplicate repeats, as read_excel does.
+
+    Blank cells become "Unnamed: {i}" and repeated names get ".1", ".2", ...
+    suffixes, so every column has a distinct string name.
+    """
+    columns = []
+    seen: dict[str, int] = {}
+    for i, cell in enumerate(header or ()):
+        name = f"Unnamed: {i}" if cell is None or str(cell).strip() == "" else str(cell)
+        base = name
+        while name in seen:
+            seen[base] += 1
+            name = f"{base}.{seen[base]}"
+        seen.setdefault(base, 0)
+        seen[name] = 0
+        columns.append(name)
+    return columns
+
+
+def _parse_and_save(
+    excel_path: Path, sheet_name: str, out_dir: Path
+) -> tuple[str, pd.DataFrame, Path]:
+    """Parse one Michigan workbook sheet and save it as CSV.
+
+    Defined at module level so it can be pickled into worker processes.
+
+    Returns:
+        Tuple of (sheet name, parsed DataFrame, CSV path)
+    """
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    # Read-only mode streams rows instead of building each sheet's DOM
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        rows = wb[sheet_name].iter_rows(values_only=True)
+        header = _normalize_header(next(rows, None))
+        df = pd.DataFrame(rows, columns=header or None)
+    finally:
+        wb.close()
+
+    csv_path = out_dir / _sheet_csv_name(sheet_name)
+    write_csv(df, csv_path)
+    # Sheets whose columns mix text and numbers are kept as CSV only
+    parquet_path = csv_path.with_suffix(".parquet")
+    if not write_parquet(df, parquet_path):
+        parquet_path.unlink(missing_ok=True)
+    return sheet_name, df, csv_path
+
 
 class MichiganDNRDownloader(BaseDownloader):
     """Download stumpage data from Michigan DNR."""
@@ -114,6 +198,8 @@ class MichiganDNRDownloader(BaseDownloader):
         Returns:
             Dictionary with parsed DataFrames
         """
+        from openpyxl import load_workbook
+
         console.print("\n[bold]Parsing Michigan DNR price data...[/bold]\n")
 
         excel_path = self.download_dir / "mi_stumpage_price_indices.xlsx"
@@ -121,25 +207,42 @@ class MichiganDNRDownloader(BaseDownloader):
             console.print("[red]Error: Excel file not found. Run download() first.[/red]")
             return {}
 
+        # Reuse the saved CSVs if the workbook has not changed since the last parse
+        cached = read_parse_stamp(excel_path)
+        if cached and all((self.download_dir / _sheet_csv_name(name)).exists() for name in cached):
+            import pandas as pd
+
+            console.print("[dim]Workbook unchanged since last parse, loading saved data[/dim]")
+            results = {}
+            for name in cached:
+                csv_path = self.download_dir / _sheet_csv_name(name)
+                parquet_path = csv_path.with_suffix(".parquet")
+                if parquet_path.exists():
+                    results[name] = pd.read_parquet(parquet_path)
+                else:
+                    results[name] = pd.read_csv(csv_path)
+            return results
+
         results = {}
 
         try:
-            # Read all sheets from the Excel file
-            xlsx = pd.ExcelFile(excel_path)
-            console.print(f"[dim]Found {len(xlsx.sheet_names)} sheets: {xlsx.sheet_names}[/dim]")
-
-            for sheet_name in xlsx.sheet_names:
-                df = pd.read_excel(xlsx, sheet_name=sheet_name)
-                results[sheet_name] = df
-                console.print(
-                    f"[green]Parsed:[/green] {sheet_name} - "
-                    f"{df.shape[0]} rows x {df.shape[1]} cols"
-                )
-
-                # Save each sheet as CSV
-                csv_path = self.download_dir / f"mi_{sheet_name.lower().replace(' ', '_')}.csv"
-                df.to_csv(csv_path, index=False)
-                console.print(f"[dim]Saved: {csv_path.name}[/dim]")
+            wb = load_workbook(excel_path, read_only=True)
+            sheet_names = wb.sheetnames
+            wb.close()
+            console.print(f"[dim]Found {len(sheet_names)} sheets: {sheet_names}[/dim]")
+
+            # Sheets are independent, so parse and save them on separate cores
+            with ProcessPoolExecutor() as executor:
+                parse_sheet = partial(_parse_and_save, excel_path, out_dir=self.download_dir)
+                for sheet_name, df, csv_path in executor.map(parse_sheet, sheet_names):
+                    results[sheet_name] = df
+                    console.print(
+                        f"[green]Parsed:[/green] {sheet_name} - "
+                        f"{df.shape[0]} rows x {df.shape[1]} cols"
+                    )
+                    console.print(f"[dim]Saved: {csv_path.name}[/dim]")
+
+            write_parse_stamp(excel_path, sheet_names)
 
         except Exception as e:
             console.print(f"[red]Error parsing Excel file:[/red] {e}")
@@ -183,13 +286,13 @@ class MinnesotaDNRDownloader(BaseDownloader):
 
         downloaded = []
 
-        for year, filename in MN_REPORTS.items():
-            url = f"{MN_BASE_URL}/{filename}"
-            try:
-                pdf_path = self.download_file(url, f"mn_stumpage_{year}.pdf")
-                downloaded.append(pdf_path)
-            except Exception as e:
-                console.print(f"[yellow]Could not download {year}:[/yellow] {e}")
+        jobs = [(url, filename) for _, url, filename in _MN_TARGETS]
+
+        for (year, _, _), result in zip(_MN_TARGETS, self.download_many(jobs)):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {year}:[/yellow] {result}")
+            else:
+                downloaded.append(result)
 
         console.print(f"\n[bold green]Downloaded {len(downloaded)} annual reports[/bold green]")
         return downloaded
@@ -197,23 +300,28 @@ class MinnesotaDNRDownloader(BaseDownloader):
     def parse(self) -> dict[str, Any]:
         """Parse Minnesota DNR PDF reports.
 
-        Note: PDF parsing requires additional tools. This method returns
-        metadata about available files.
+        Extracts each report's text layer (cached by content hash); table
+        extraction is not yet automated.
 
         Returns:
-            Dictionary with file metadata
+            Dictionary with file metadata and extracted text
         """
         console.print("\n[bold]Minnesota DNR reports are PDFs.[/bold]")
-        console.print("[dim]PDF parsing requires manual extraction or OCR tools.[/dim]\n")
+        console.print("[dim]Extracting text layers; tables still need manual review.[/dim]\n")
+
+        pdf_paths = {
+            year: self.download_dir / f"mn_stumpage_{year}.pdf" for year in MN_REPORTS
+        }
+        texts = self.extract_pdf_texts([p for p in pdf_paths.values() if p.exists()])
 
         results = {}
-        for year in MN_REPORTS:
-            pdf_path = self.download_dir / f"mn_stumpage_{year}.pdf"
+        for year, pdf_path in pdf_paths.items():
             if pdf_path.exists():
                 results[year] = {
                     "file": pdf_path,
                     "status": "downloaded",
                     "format": "PDF",
+                    "text": texts.get(pdf_path),
                 }
 
         return results
@@ -270,24 +378,21 @@ class WisconsinDNRDownloader(BaseDownloader):
 
         downloaded = []
 
-        for file_id, file_info in WI_STUMPAGE_FILES.items():
-            url = file_info["url"]
-            description = file_info["description"]
-
-            try:
-                pdf_path = self.download_file(url, f"wi_{file_id}.pdf")
-
-                # Verify it's a valid PDF (not an error page)
-                size_kb = pdf_path.stat().st_size / 1024
-                if size_kb > 5:  # Valid PDFs should be > 5KB
-                    downloaded.append(pdf_path)
-                    console.print(f"[dim]{description}[/dim]")
-                else:
-                    console.print(f"[yellow]Invalid file for {file_id} (too small)[/yellow]")
-                    pdf_path.unlink()
-
-            except Exception as e:
-                console.print(f"[yellow]Could not download {file_id}:[/yellow] {e}")
+        jobs = [(url, filename) for _, url, filename in _WI_TARGETS]
+
+        # Error pages are rejected by size, type or their first bytes before
+        # anything is written, so a valid earlier copy is never replaced
+        results = self.download_many(
+            jobs,
+            min_size=5 * 1024,
+            validate=looks_like_pdf,
+            content_types=PDF_CONTENT_TYPES,
+        )
+        for (file_id, _, _), result in zip(_WI_TARGETS, results):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {file_id}:[/yellow] {result}")
+                continue
+            downloaded.append(result)
 
         console.print(f"\n[bold green]Downloaded {len(downloaded)} stumpage rate files[/bold green]")
         return downloaded
@@ -295,19 +400,24 @@ class WisconsinDNRDownloader(BaseDownloader):
     def parse(self) -> dict[str, Any]:
         """Parse Wisconsin DNR PDF reports.
 
-        Note: PDF parsing requires additional tools like pdfplumber.
-        The PDFs contain tabular stumpage rates by species and product type.
+        Extracts each PDF's text layer (cached by content hash). The PDFs
+        contain tabular stumpage rates by species and product type.
 
         Returns:
-            Dictionary with file metadata
+            Dictionary with file metadata and extracted text
         """
         console.print("\n[bold]Wisconsin DNR reports are PDFs.[/bold]")
-        console.print("[dim]PDF parsing requires pdfplumber or similar tools.[/dim]")
+        console.print("[dim]Extracting text layers; tables still need manual review.[/dim]")
         console.print("[dim]Data contains 3-year weighted averages by species/product.[/dim]\n")
 
+        pdf_paths = {
+            file_id: self.download_dir / f"wi_{file_id}.pdf" for file_id in WI_STUMPAGE_FILES
+        }
+        texts = self.extract_pdf_texts([p for p in pdf_paths.values() if p.exists()])
+
         results = {}
         for file_id, file_info in WI_STUMPAGE_FILES.items():
-            pdf_path = self.download_dir / f"wi_{file_id}.pdf"
+            pdf_path = pdf_paths[file_id]
             if pdf_path.exists():
                 size_kb = pdf_path.stat().st_size / 1024
                 results[file_id] = {
@@ -316,6 +426,7 @@ class WisconsinDNRDownloader(BaseDownloader):
                     "status": "downloaded",
                     "format": "PDF",
                     "size_kb": round(size_kb, 1),
+                    "text": texts.get(pdf_path),
                 }
 
         return results
@@ -362,20 +473,26 @@ class LakeStatesDownloader:
         Returns:
             Dictionary mapping state to list of downloaded files
         """
-        results = {}
-
-        with self.michigan as mi:
-            results["michigan"] = mi.download()
-            mi.parse()
-
-        with self.minnesota as mn:
-            results["minnesota"] = mn.download()
-
-        with self.wisconsin as wi:
-            results["wisconsin"] = wi.download()
+        # The three states are served by different hosts, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "michigan": executor.submit(self._download_state, self.michigan),
+                "minnesota": executor.submit(self._download_state, self.minnesota),
+                "wisconsin": executor.submit(self._download_state, self.wisconsin),
+            }
+            results = {state: future.result() for state, future in futures.items()}
+
+        # Excel parsing is CPU-bound, so it runs once the downloads are done
+        self.michigan.parse()
 
         return results
 
+    @staticmethod
+    def _download_state(downloader: BaseDownloader) -> list[Path]:
+        """Run a single state's download inside its client context."""
+        with downloader as d:
+            return d.download()
+
     def get_summary(self) -> None:
         """Print summary of all Lake States data."""
         self.michigan.get_summary()
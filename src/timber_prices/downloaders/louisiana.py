@@ -7,12 +7,10 @@ Data source: https://www.ldaf.la.gov/land/forestry/forestry-reports
 """
 
 from pathlib import Path
-from typing import Any
 
 from rich.console import Console
-from rich.table import Table
 
-from timber_prices.downloaders.base import BaseDownloader
+from timber_prices.downloaders.base import QuarterlyReportDownloader
 
 console = Console()
 
@@ -126,7 +124,7 @@ ADDITIONAL_REPORTS = {
 }
 
 
-class LouisianaForestryDownloader(BaseDownloader):
+class LouisianaForestryDownloader(QuarterlyReportDownloader):
     """Download stumpage data from Louisiana Department of Agriculture and Forestry.
 
     LDAF Office of Forestry publishes quarterly reports of stumpage prices
@@ -146,6 +144,12 @@ class LouisianaForestryDownloader(BaseDownloader):
     - Statewide averages
     """
 
+    quarterly_reports = QUARTERLY_REPORTS
+    filename_template = "la_forestry_{year}_q{quarter}.pdf"
+    state_name = "Louisiana"
+    coverage = "Quarterly stumpage prices by region (2010-2025)"
+    contents = "Data contains regional and statewide stumpage averages."
+
     @property
     def source_name(self) -> str:
         return "Louisiana LDAF Forestry Reports"
@@ -154,70 +158,6 @@ class LouisianaForestryDownloader(BaseDownloader):
     def source_id(self) -> str:
         return "la_forestry"
 
-    def download(self, years: list[int] | None = None) -> list[Path]:
-        """Download Louisiana forestry quarterly reports.
-
-        Args:
-            years: Optional list of years to download. Defaults to all available.
-
-        Returns:
-            List of paths to downloaded PDF files
-        """
-        console.print(f"\n[bold blue]{'='*60}[/bold blue]")
-        console.print(f"[bold]{self.source_name}[/bold]")
-        console.print(f"[dim]Quarterly stumpage prices by region (2010-2025)[/dim]")
-        console.print(f"[bold blue]{'='*60}[/bold blue]\n")
-
-        # Determine which years to download
-        if years is None:
-            years = sorted(QUARTERLY_REPORTS.keys(), reverse=True)
-
-        downloaded = []
-        failed = []
-
-        for year in years:
-            if year not in QUARTERLY_REPORTS:
-                console.print(f"[yellow]No reports available for {year}[/yellow]")
-                continue
-
-            quarters = QUARTERLY_REPORTS[year]
-            for quarter, url in quarters.items():
-                local_filename = f"la_forestry_{year}_q{quarter}.pdf"
-
-                try:
-                    pdf_path = self.download_file(url, local_filename)
-
-                    # Verify it's a valid PDF
-                    size_kb = pdf_path.stat().st_size / 1024
-                    if size_kb > 5:
-                        downloaded.append(pdf_path)
-                    else:
-                        console.print(f"[yellow]Invalid file for {year} Q{quarter} (too small)[/yellow]")
-                        pdf_path.unlink()
-                        failed.append((year, quarter))
-
-                except Exception as e:
-                    console.print(f"[yellow]Could not download {year} Q{quarter}:[/yellow] {e}")
-                    failed.append((year, quarter))
-
-        console.print(f"\n[bold green]Downloaded {len(downloaded)} quarterly reports[/bold green]")
-        if failed:
-            console.print(f"[yellow]Failed: {len(failed)} reports[/yellow]")
-
-        return downloaded
-
-    def download_recent(self, num_years: int = 5) -> list[Path]:
-        """Download the most recent N years of reports.
-
-        Args:
-            num_years: Number of recent years to download
-
-        Returns:
-            List of paths to downloaded files
-        """
-        recent_years = sorted(QUARTERLY_REPORTS.keys(), reverse=True)[:num_years]
-        return self.download(years=recent_years)
-
     def download_additional(self) -> list[Path]:
         """Download additional reports (annual summaries, production reports).
 
@@ -226,76 +166,20 @@ class LouisianaForestryDownloader(BaseDownloader):
         """
         console.print("\n[bold]Downloading additional reports...[/bold]")
 
+        # Same CDN host as the quarterly reports, so these share its pooled
+        # connections
+        jobs = [(url, f"la_{report_name}.pdf") for report_name, url in ADDITIONAL_REPORTS.items()]
+
         downloaded = []
-        for report_name, url in ADDITIONAL_REPORTS.items():
-            try:
-                pdf_path = self.download_file(url, f"la_{report_name}.pdf")
-                downloaded.append(pdf_path)
-                console.print(f"[green]Downloaded:[/green] {report_name}")
-            except Exception as e:
-                console.print(f"[yellow]Could not download {report_name}:[/yellow] {e}")
+        for report_name, result in zip(ADDITIONAL_REPORTS, self.download_many(jobs)):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {report_name}:[/yellow] {result}")
+                continue
+            downloaded.append(result)
+            console.print(f"[green]Downloaded:[/green] {report_name}")
 
         return downloaded
 
-    def parse(self) -> dict[str, Any]:
-        """Parse Louisiana forestry PDF reports.
-
-        Note: PDF parsing requires additional tools like pdfplumber.
-
-        Returns:
-            Dictionary with file metadata
-        """
-        console.print("\n[bold]Louisiana reports are PDFs.[/bold]")
-        console.print("[dim]PDF parsing requires pdfplumber or similar tools.[/dim]")
-        console.print("[dim]Data contains regional and statewide stumpage averages.[/dim]\n")
-
-        results = {}
-        for year in QUARTERLY_REPORTS:
-            year_data = {}
-            for quarter in QUARTERLY_REPORTS[year]:
-                pdf_path = self.download_dir / f"la_forestry_{year}_q{quarter}.pdf"
-                if pdf_path.exists():
-                    size_kb = pdf_path.stat().st_size / 1024
-                    year_data[f"Q{quarter}"] = {
-                        "file": str(pdf_path),
-                        "status": "downloaded",
-                        "format": "PDF",
-                        "size_kb": round(size_kb, 1),
-                    }
-            if year_data:
-                results[year] = year_data
-
-        return results
-
-    def get_summary(self) -> None:
-        """Print summary of Louisiana data."""
-        table = Table(title="Louisiana LDAF Forestry Reports")
-        table.add_column("Year", style="cyan")
-        table.add_column("Q1", style="white")
-        table.add_column("Q2", style="white")
-        table.add_column("Q3", style="white")
-        table.add_column("Q4", style="white")
-
-        for year in sorted(QUARTERLY_REPORTS.keys(), reverse=True):
-            row = [str(year)]
-            for quarter in [1, 2, 3, 4]:
-                pdf_path = self.download_dir / f"la_forestry_{year}_q{quarter}.pdf"
-                if pdf_path.exists():
-                    row.append("[green]Yes[/green]")
-                elif quarter in QUARTERLY_REPORTS.get(year, {}):
-                    row.append("[dim]No[/dim]")
-                else:
-                    row.append("[dim]-[/dim]")
-            table.add_row(*row)
-
-        console.print(table)
-
-        # Count total available and downloaded
-        total_available = sum(len(q) for q in QUARTERLY_REPORTS.values())
-        total_downloaded = len(list(self.download_dir.glob("la_forestry_*_q*.pdf")))
-        console.print(f"\n[dim]Total available: {total_available} quarterly reports ({len(QUARTERLY_REPORTS)} years)[/dim]")
-        console.print(f"[dim]Downloaded: {total_downloaded} reports[/dim]")
-
 
 if __name__ == "__main__":
     with LouisianaForestryDownloader() as downloader:
@@ -12,7 +12,7 @@ from typing import Any
 from rich.console import Console
 from rich.table import Table
 
-from timber_prices.downloaders.base import BaseDownloader
+from timber_prices.downloaders.base import PDF_CONTENT_TYPES, BaseDownloader, looks_like_pdf
 
 console = Console()
 
@@ -48,6 +48,12 @@ REPORT_IDS = {
     2000: 392559,
 }
 
+# Resolved (url, local filename) for each year, built once at import
+_ME_TARGETS = {
+    year: (f"{BASE_URL}?id={report_id}&an=1", f"me_stumpage_{year}.pdf")
+    for year, report_id in REPORT_IDS.items()
+}
+
 
 class MaineForestServiceDownloader(BaseDownloader):
     """Download stumpage data from Maine Forest Service."""
@@ -80,28 +86,28 @@ class MaineForestServiceDownloader(BaseDownloader):
 
         downloaded = []
 
+        available = []
         for year in years:
             if year not in REPORT_IDS:
                 console.print(f"[yellow]No report available for {year}[/yellow]")
                 continue
-
-            report_id = REPORT_IDS[year]
-            url = f"{BASE_URL}?id={report_id}&an=1"
-            pdf_path = self.download_dir / f"me_stumpage_{year}.pdf"
-
-            try:
-                pdf_path_result = self.download_file(url, f"me_stumpage_{year}.pdf")
-
-                # Verify it's a valid PDF (not an error page)
-                size_kb = pdf_path_result.stat().st_size / 1024
-                if size_kb > 5:  # Valid PDFs should be > 5KB
-                    downloaded.append(pdf_path_result)
-                else:
-                    console.print(f"[yellow]Invalid file for {year} (too small)[/yellow]")
-                    pdf_path_result.unlink()
-
-            except Exception as e:
-                console.print(f"[yellow]Could not download {year}:[/yellow] {e}")
+            available.append(year)
+
+        jobs = [_ME_TARGETS[year] for year in available]
+
+        # Error pages are rejected by size, type or their first bytes before
+        # anything is written, so a valid earlier copy is never replaced
+        results = self.download_many(
+            jobs,
+            min_size=5 * 1024,
+            validate=looks_like_pdf,
+            content_types=PDF_CONTENT_TYPES,
+        )
+        for year, result in zip(available, results):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {year}:[/yellow] {result}")
+                continue
+            downloaded.append(result)
 
         console.print(f"\n[bold green]Downloaded {len(downloaded)} annual reports[/bold green]")
         return downloaded
@@ -121,17 +127,22 @@ class MaineForestServiceDownloader(BaseDownloader):
     def parse(self) -> dict[str, Any]:
         """Parse Maine stumpage PDF reports.
 
-        Note: PDF parsing requires additional tools like pdfplumber.
+        Extracts each report's text layer (cached by content hash); table
+        extraction is not yet automated.
 
         Returns:
-            Dictionary with file metadata
+            Dictionary with file metadata and extracted text
         """
         console.print("\n[bold]Maine reports are PDFs.[/bold]")
-        console.print("[dim]PDF parsing requires pdfplumber or similar tools.[/dim]\n")
+        console.print("[dim]Extracting text layers; tables still need manual review.[/dim]\n")
+
+        pdf_paths = {
+            year: self.download_dir / f"me_stumpage_{year}.pdf" for year in REPORT_IDS
+        }
+        texts = self.extract_pdf_texts([p for p in pdf_paths.values() if p.exists()])
 
         results = {}
-        for year in REPORT_IDS:
-            pdf_path = self.download_dir / f"me_stumpage_{year}.pdf"
+        for year, pdf_path in pdf_paths.items():
             if pdf_path.exists():
                 size_kb = pdf_path.stat().st_size / 1024
                 results[year] = {
@@ -139,6 +150,7 @@ class MaineForestServiceDownloader(BaseDownloader):
                     "status": "downloaded",
                     "format": "PDF",
                     "size_kb": round(size_kb, 1),
+                    "text": texts.get(pdf_path),
                 }
 
         return results
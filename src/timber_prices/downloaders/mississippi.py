@@ -7,15 +7,7 @@ averages for pine and hardwood products.
 Data source: https://extension.msstate.edu/natural-resources/forestry/forest-economics/timber-prices
 """
 
-from pathlib import Path
-from typing import Any
-
-from rich.console import Console
-from rich.table import Table
-
-from timber_prices.downloaders.base import BaseDownloader
-
-console = Console()
+from timber_prices.downloaders.base import QuarterlyReportDownloader
 
 # Base URL for Mississippi State Extension
 BASE_URL = "https://extension.msstate.edu"
@@ -99,7 +91,7 @@ QUARTERLY_REPORTS = {
 }
 
 
-class MississippiExtensionDownloader(BaseDownloader):
+class MississippiExtensionDownloader(QuarterlyReportDownloader):
     """Download timber price data from Mississippi State Extension.
 
     Mississippi publishes quarterly timber price reports with statewide
@@ -114,18 +106,19 @@ class MississippiExtensionDownloader(BaseDownloader):
     - Hardwood pulpwood
     """
 
-    @property
-    def source_name(self) -> str:
-        return "Mississippi State Extension Timber Price Reports"
-
-    @property
-    def source_id(self) -> str:
-        return "ms_extension"
+    quarterly_reports = QUARTERLY_REPORTS
+    filename_template = "ms_timber_{year}_q{quarter}.pdf"
+    state_name = "Mississippi"
+    coverage = "Quarterly stumpage prices - pine & hardwood (2013-2025)"
+    contents = "Data contains statewide stumpage averages by product."
 
-    def _get_url(self, report_info: dict) -> str:
+    @classmethod
+    def report_url(cls, year: int, quarter: int, report_info: dict) -> str:
         """Get the download URL for a report.
 
         Args:
+            year: Year of the report
+            quarter: Quarter number (1-4)
             report_info: Dictionary with 'type' and 'id' or 'path'
 
         Returns:
@@ -136,134 +129,13 @@ class MississippiExtensionDownloader(BaseDownloader):
         else:
             return f"{BASE_URL}{report_info['path']}"
 
-    def download(self, years: list[int] | None = None) -> list[Path]:
-        """Download Mississippi timber price reports.
-
-        Args:
-            years: Optional list of years to download. Defaults to all available.
-
-        Returns:
-            List of paths to downloaded PDF files
-        """
-        console.print(f"\n[bold blue]{'='*60}[/bold blue]")
-        console.print(f"[bold]{self.source_name}[/bold]")
-        console.print(f"[dim]Quarterly stumpage prices - pine & hardwood (2013-2025)[/dim]")
-        console.print(f"[bold blue]{'='*60}[/bold blue]\n")
-
-        # Determine which years to download
-        if years is None:
-            years = sorted(QUARTERLY_REPORTS.keys(), reverse=True)
-
-        downloaded = []
-        failed = []
-
-        for year in years:
-            if year not in QUARTERLY_REPORTS:
-                console.print(f"[yellow]No reports available for {year}[/yellow]")
-                continue
-
-            quarters = QUARTERLY_REPORTS[year]
-            for quarter, report_info in quarters.items():
-                url = self._get_url(report_info)
-                local_filename = f"ms_timber_{year}_q{quarter}.pdf"
-
-                try:
-                    pdf_path = self.download_file(url, local_filename)
-
-                    # Verify it's a valid PDF (not an error page or image)
-                    size_kb = pdf_path.stat().st_size / 1024
-
-                    # Check if it's actually a PDF by reading first bytes
-                    with open(pdf_path, "rb") as f:
-                        header = f.read(4)
-
-                    if header == b"%PDF" and size_kb > 5:
-                        downloaded.append(pdf_path)
-                    else:
-                        console.print(f"[yellow]Invalid file for {year} Q{quarter} (not a PDF)[/yellow]")
-                        pdf_path.unlink()
-                        failed.append((year, quarter))
-
-                except Exception as e:
-                    console.print(f"[yellow]Could not download {year} Q{quarter}:[/yellow] {e}")
-                    failed.append((year, quarter))
-
-        console.print(f"\n[bold green]Downloaded {len(downloaded)} quarterly reports[/bold green]")
-        if failed:
-            console.print(f"[yellow]Failed: {len(failed)} reports[/yellow]")
-
-        return downloaded
-
-    def download_recent(self, num_years: int = 5) -> list[Path]:
-        """Download the most recent N years of reports.
-
-        Args:
-            num_years: Number of recent years to download
-
-        Returns:
-            List of paths to downloaded files
-        """
-        recent_years = sorted(QUARTERLY_REPORTS.keys(), reverse=True)[:num_years]
-        return self.download(years=recent_years)
-
-    def parse(self) -> dict[str, Any]:
-        """Parse Mississippi timber price PDF reports.
-
-        Note: PDF parsing requires additional tools like pdfplumber.
-
-        Returns:
-            Dictionary with file metadata
-        """
-        console.print("\n[bold]Mississippi reports are PDFs.[/bold]")
-        console.print("[dim]PDF parsing requires pdfplumber or similar tools.[/dim]")
-        console.print("[dim]Data contains statewide stumpage averages by product.[/dim]\n")
-
-        results = {}
-        for year in QUARTERLY_REPORTS:
-            year_data = {}
-            for quarter in QUARTERLY_REPORTS[year]:
-                pdf_path = self.download_dir / f"ms_timber_{year}_q{quarter}.pdf"
-                if pdf_path.exists():
-                    size_kb = pdf_path.stat().st_size / 1024
-                    year_data[f"Q{quarter}"] = {
-                        "file": str(pdf_path),
-                        "status": "downloaded",
-                        "format": "PDF",
-                        "size_kb": round(size_kb, 1),
-                    }
-            if year_data:
-                results[year] = year_data
-
-        return results
-
-    def get_summary(self) -> None:
-        """Print summary of Mississippi data."""
-        table = Table(title="Mississippi State Extension Timber Price Reports")
-        table.add_column("Year", style="cyan")
-        table.add_column("Q1", style="white")
-        table.add_column("Q2", style="white")
-        table.add_column("Q3", style="white")
-        table.add_column("Q4", style="white")
-
-        for year in sorted(QUARTERLY_REPORTS.keys(), reverse=True):
-            row = [str(year)]
-            for quarter in [1, 2, 3, 4]:
-                pdf_path = self.download_dir / f"ms_timber_{year}_q{quarter}.pdf"
-                if pdf_path.exists():
-                    row.append("[green]Yes[/green]")
-                elif quarter in QUARTERLY_REPORTS.get(year, {}):
-                    row.append("[dim]No[/dim]")
-                else:
-                    row.append("[dim]-[/dim]")
-            table.add_row(*row)
-
-        console.print(table)
+    @property
+    def source_name(self) -> str:
+        return "Mississippi State Extension Timber Price Reports"
 
-        # Count total available and downloaded
-        total_available = sum(len(q) for q in QUARTERLY_REPORTS.values())
-        total_downloaded = len(list(self.download_dir.glob("ms_timber_*.pdf")))
-        console.print(f"\n[dim]Total available: {total_available} reports ({len(QUARTERLY_REPORTS)} years)[/dim]")
-        console.print(f"[dim]Downloaded: {total_downloaded} reports[/dim]")
+    @property
+    def source_id(self) -> str:
+        return "ms_extension"
 
 
 if __name__ == "__main__":
@@ -6,14 +6,27 @@ Data available from 1976-2024 for North Carolina regions.
 Data source: https://content.ces.ncsu.edu/historic-north-carolina-timber-stumpage-prices-1976-2014
 """
 
+from __future__ import annotations
+
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
-from bs4 import BeautifulSoup
 from rich.console import Console
 from rich.table import Table
 
-from timber_prices.downloaders.base import BaseDownloader
+from timber_prices.downloaders.base import (
+    BaseDownloader,
+    read_parse_stamp,
+    write_csv,
+    write_parquet,
+    write_parse_stamp,
+)
+
+# pandas, pyarrow and lxml are imported where they are used so that
+# importing this module for downloads alone stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
 
 console = Console()
 
@@ -35,6 +48,46 @@ PRODUCT_NAMES = {
     "hardwood_pulpwood": "Hardwood Pulpwood",
 }
 
+# Dollar signs and thousands separators stripped from price cells
+_CURRENCY_RE = re.compile(r"[$,]")
+
+# Species/product pairs recognized in table captions and headings
+_PRODUCT_RE = re.compile(r"(pine|hardwood).*?(sawtimber|pulp)", re.IGNORECASE | re.DOTALL)
+
+PRODUCT_KEYS = {
+    ("pine", "sawtimber"): "pine_sawtimber",
+    ("pine", "pulp"): "pine_pulpwood",
+    ("hardwood", "sawtimber"): "hardwood_sawtimber",
+    ("hardwood", "pulp"): "hardwood_pulpwood",
+}
+
+
+def _product_from_label(table) -> str | None:
+    """Product named in a table's caption or nearest preceding heading."""
+    label = table.xpath(
+        "caption//text() | preceding::*[self::h2 or self::h3 or self::h4][1]//text()"
+    )
+    match = _PRODUCT_RE.search(" ".join(label))
+    if match:
+        species, product = (group.lower() for group in match.groups())
+        return PRODUCT_KEYS[(species, product)]
+    return None
+
+
+def _product_from_table_text(table) -> str | None:
+    """Product named anywhere in a table's own text."""
+    table_text = table.text_content().lower()
+
+    if "pine" in table_text and "sawtimber" in table_text and "pulp" not in table_text:
+        return "pine_sawtimber"
+    elif "pine" in table_text and "pulp" in table_text:
+        return "pine_pulpwood"
+    elif "hardwood" in table_text and "sawtimber" in table_text:
+        return "hardwood_sawtimber"
+    elif "hardwood" in table_text and "pulp" in table_text:
+        return "hardwood_pulpwood"
+    return None
+
 
 class NCStateDownloader(BaseDownloader):
     """Download stumpage data from NC State Extension."""
@@ -58,14 +111,8 @@ class NCStateDownloader(BaseDownloader):
         console.print(f"[dim]Historic timber stumpage prices 1976-2024[/dim]")
         console.print(f"[bold blue]{'='*60}[/bold blue]\n")
 
-        # Download the HTML page
-        response = self.client.get(HISTORIC_PRICES_URL)
-        response.raise_for_status()
-
-        # Save the raw HTML
-        html_path = self.download_dir / "historic_prices.html"
-        html_path.write_text(response.text, encoding="utf-8")
-        console.print(f"[green]Saved:[/green] {html_path}")
+        # Stream the HTML page to disk over the shared client
+        html_path = self.download_file(HISTORIC_PRICES_URL, "historic_prices.html")
 
         return [html_path]
 
@@ -75,6 +122,8 @@ class NCStateDownloader(BaseDownloader):
         Returns:
             Dictionary mapping product names to DataFrames with price data
         """
+        from lxml import html as lxml_html
+
         console.print("\n[bold]Parsing NC State historic price tables...[/bold]\n")
 
         html_path = self.download_dir / "historic_prices.html"
@@ -82,11 +131,21 @@ class NCStateDownloader(BaseDownloader):
             console.print("[red]Error: HTML file not found. Run download() first.[/red]")
             return {}
 
-        html_content = html_path.read_text(encoding="utf-8")
-        soup = BeautifulSoup(html_content, "lxml")
+        # Reuse the saved CSVs if the page has not changed since the last parse
+        cached = read_parse_stamp(html_path)
+        if cached and all((self.download_dir / f"{key}.csv").exists() for key in cached):
+            console.print("[dim]HTML unchanged since last parse, loading saved data[/dim]")
+            return {key: self._load_saved(key) for key in cached}
+
+        # Let libxml2 read and decode the file directly rather than building
+        # a Python str of the whole document. The page is UTF-8; without an
+        # explicit encoding, libxml2 would fall back to latin-1 whenever the
+        # page lacks a <meta charset>
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+        tree = lxml_html.parse(str(html_path), parser=parser).getroot()
 
         # Find all tables in the page
-        tables = soup.find_all("table")
+        tables = tree.xpath("//table")
         console.print(f"[dim]Found {len(tables)} tables in the HTML[/dim]")
 
         results = {}
@@ -97,7 +156,7 @@ class NCStateDownloader(BaseDownloader):
                 df = self._parse_table(table, i)
                 if df is not None and not df.empty:
                     # Try to identify the product based on table content
-                    product_key = self._identify_product(table, i)
+                    product_key = self._identify_product(table, i, results)
                     results[product_key] = df
                     console.print(
                         f"[green]Parsed:[/green] {PRODUCT_NAMES.get(product_key, product_key)} - "
@@ -109,12 +168,15 @@ class NCStateDownloader(BaseDownloader):
         # Save parsed data to CSV
         if results:
             self._save_parsed_data(results)
+            write_parse_stamp(html_path, list(results))
 
         return results
 
     def _parse_table(self, table, table_index: int) -> pd.DataFrame | None:
         """Parse an HTML table element to DataFrame."""
-        rows = table.find_all("tr")
+        import pandas as pd
+
+        rows = table.xpath(".//tr")
         if len(rows) < 3:  # Need header + at least some data
             return None
 
@@ -122,8 +184,7 @@ class NCStateDownloader(BaseDownloader):
         headers = None
 
         for row in rows:
-            cells = row.find_all(["th", "td"])
-            cell_texts = [cell.get_text(strip=True) for cell in cells]
+            cell_texts = [cell.text_content().strip() for cell in row.xpath("./th|./td")]
 
             # Skip empty rows
             if not any(cell_texts):
@@ -150,6 +211,8 @@ class NCStateDownloader(BaseDownloader):
 
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean up parsed DataFrame."""
+        import pandas as pd
+
         # Standardize column names
         df.columns = [col.lower().strip().replace(" ", "_").replace("-", "_") for col in df.columns]
 
@@ -172,60 +235,88 @@ class NCStateDownloader(BaseDownloader):
             df["year"] = df["year"].astype(int)
 
         # Convert price columns to numeric
-        price_cols = [c for c in df.columns if c != "year"]
-        for col in price_cols:
-            # Remove dollar signs, commas, handle "--" as NaN
-            df[col] = df[col].astype(str).str.replace(r"[$,]", "", regex=True)
-            df[col] = df[col].replace(["--", "-", "n/a", "N/A", ""], pd.NA)
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+        # Strip dollar signs and commas across all columns in one pass;
+        # placeholders like "--" and "n/a" are coerced to NaN
+        price_cols = df.columns.difference(["year"])
+        df[price_cols] = (
+            df[price_cols]
+            .replace(_CURRENCY_RE, "", regex=True)
+            .apply(pd.to_numeric, errors="coerce")
+        )
 
         return df
 
-    def _identify_product(self, table, index: int) -> str:
-        """Try to identify which product this table represents."""
-        # Look for identifying text in preceding elements or table caption
-        table_text = table.get_text().lower()
-
-        if "pine" in table_text and "sawtimber" in table_text and "pulp" not in table_text:
-            return "pine_sawtimber"
-        elif "pine" in table_text and "pulp" in table_text:
-            return "pine_pulpwood"
-        elif "hardwood" in table_text and "sawtimber" in table_text:
-            return "hardwood_sawtimber"
-        elif "hardwood" in table_text and "pulp" in table_text:
-            return "hardwood_pulpwood"
-        else:
-            # Fall back to index-based naming matching expected order
-            if index < len(PRODUCTS):
-                return PRODUCTS[index]
+    def _identify_product(self, table, index: int, taken: dict) -> str:
+        """Try to identify which product this table represents.
+
+        Args:
+            table: The lxml table element
+            index: Position of the table on the page
+            taken: Products already parsed; a table never replaces one
+
+        Returns:
+            Product key, or table_{index} if it cannot be told apart
+        """
+        product_key = _product_from_label(table) or _product_from_table_text(table)
+
+        # Fall back to index-based naming matching expected order
+        if product_key is None and index < len(PRODUCTS):
+            product_key = PRODUCTS[index]
+
+        # Tables under one heading share its label; keep each one
+        if product_key is None or product_key in taken:
             return f"table_{index}"
+        return product_key
 
     def _save_parsed_data(self, results: dict[str, pd.DataFrame]) -> None:
         """Save parsed data to CSV files."""
+        import pandas as pd
+
         for product_key, df in results.items():
             csv_path = self.download_dir / f"{product_key}.csv"
-            df.to_csv(csv_path, index=False)
+            write_csv(df, csv_path)
+            # Tables Arrow cannot type are kept as CSV only; drop any older
+            # Parquet so _load_saved does not prefer it over the new CSV
+            parquet_path = csv_path.with_suffix(".parquet")
+            if not write_parquet(df, parquet_path):
+                parquet_path.unlink(missing_ok=True)
             console.print(f"[green]Saved CSV:[/green] {csv_path}")
 
-        # Also create a combined long-format file
-        combined_data = []
-        for product_key, df in results.items():
-            df_long = df.melt(
-                id_vars=["year"] if "year" in df.columns else [],
-                var_name="region",
-                value_name="price",
-            )
-            df_long["product"] = product_key
-            combined_data.append(df_long)
-
-        if combined_data:
-            combined_df = pd.concat(combined_data, ignore_index=True)
-            combined_path = self.download_dir / "nc_stumpage_prices_combined.csv"
-            combined_df.to_csv(combined_path, index=False)
-            console.print(f"[green]Saved combined CSV:[/green] {combined_path}")
+        # Also create a combined long-format file. Each product is melted on
+        # its own columns, so no padding rows appear and every missing price
+        # in the source tables is kept
+        combined_df = pd.concat(
+            [
+                df.melt(
+                    id_vars=["year"] if "year" in df.columns else [],
+                    var_name="region",
+                    value_name="price",
+                ).assign(product=product_key)
+                for product_key, df in results.items()
+            ],
+            ignore_index=True,
+        )
+
+        combined_path = self.download_dir / "nc_stumpage_prices_combined.csv"
+        write_csv(combined_df, combined_path)
+        combined_parquet = combined_path.with_suffix(".parquet")
+        if not write_parquet(combined_df, combined_parquet):
+            combined_parquet.unlink(missing_ok=True)
+        console.print(f"[green]Saved combined CSV:[/green] {combined_path}")
+
+    def _load_saved(self, product_key: str) -> pd.DataFrame:
+        """Load a saved product table, preferring Parquet over CSV."""
+        import pandas as pd
+
+        parquet_path = self.download_dir / f"{product_key}.parquet"
+        if parquet_path.exists():
+            return pd.read_parquet(parquet_path)
+        return pd.read_csv(self.download_dir / f"{product_key}.csv")
 
     def get_summary(self) -> None:
         """Print a summary of available NC State data."""
+        import pandas as pd
+
         table = Table(title="NC State Extension Stumpage Price Data")
         table.add_column("Product", style="cyan")
         table.add_column("Status", style="yellow")
@@ -11,11 +11,15 @@ Data sources:
 - https://fpr.vermont.gov/stumpage-price-reports
 """
 
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from urllib.parse import urljoin
 
 import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 from rich.console import Console
 from rich.table import Table
 
@@ -43,6 +47,91 @@ PA_ARCHIVES_URL = "https://extension.psu.edu/timber-market-report-archives"
 # Vermont FPR
 VT_BASE_URL = "https://fpr.vermont.gov/stumpage-price-reports"
 
+# Link filters evaluated inside lxml, so non-matching anchors never reach Python
+PA_REPORT_LINKS_XPATH = (
+    "//a[contains(@href, 'timber-market-report')"
+    " and contains(translate(., 'QUARTER', 'quarter'), 'quarter')]"
+)
+PDF_LINKS_XPATH = "//a[contains(translate(@href, 'PDF', 'pdf'), '.pdf')]"
+
+# Column-header words that mark a Penn State table as a price table
+_HEADER_TOKENS = frozenset({"price", "prices", "species"})
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Saved report pages are UTF-8; without this, pages lacking a <meta charset>
+# would be decoded as latin-1
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+@lru_cache(maxsize=8)
+def _parse_page(path: Path, mtime_ns: int) -> lxml_html.HtmlElement:
+    """Parse a saved index page; mtime is part of the key so rewrites miss."""
+    return lxml_html.fromstring(path.read_bytes(), parser=_UTF8_HTML_PARSER)
+
+
+def _parsed_page(path: Path) -> lxml_html.HtmlElement:
+    """Parsed tree for a saved index page, reused across downloader instances."""
+    return _parse_page(path, path.stat().st_mtime_ns)
+
+
+def _price_table(table: lxml_html.HtmlElement) -> pd.DataFrame | None:
+    """Parse a Penn State HTML table if it looks like a price table.
+
+    The header is the first row with a price/species word in it; only the
+    rows after it with the same number of cells are kept.
+    """
+    rows = table.xpath(".//tr")
+    if len(rows) < 2:
+        return None
+
+    data = []
+    headers = None
+
+    for row in rows:
+        cell_texts = [
+            "".join(text.strip() for text in cell.xpath(".//text()"))
+            for cell in row.xpath(".//th | .//td")
+        ]
+
+        if not any(cell_texts):
+            continue
+
+        if headers is None:
+            header_words = _WORD_RE.findall(" ".join(cell_texts).lower())
+            if not _HEADER_TOKENS.isdisjoint(header_words):
+                headers = cell_texts
+            continue
+
+        if len(cell_texts) == len(headers):
+            data.append(cell_texts)
+
+    if not headers or not data:
+        return None
+
+    return pd.DataFrame(data, columns=headers)
+
+
+def _read_report_tables(
+    html_path: Path,
+) -> tuple[Path, list[tuple[int, pd.DataFrame]], str | None]:
+    """Read the price tables from a saved Penn State report.
+
+    Defined at module level so it can be pickled into worker processes.
+    Every table on the page is enumerated, so the returned positions match
+    the page; non-price tables are dropped here and never sent back.
+
+    Returns:
+        Tuple of (path, [(table position, DataFrame)], error message or None)
+    """
+    try:
+        tree = lxml_html.parse(str(html_path), parser=_UTF8_HTML_PARSER).getroot()
+        tables = [] if tree is None else tree.xpath("//table")
+        parsed = [(i, _price_table(table)) for i, table in enumerate(tables)]
+    except Exception as e:
+        return html_path, [], str(e)
+
+    return html_path, [(i, df) for i, df in parsed if df is not None], None
+
 
 class NewYorkDECDownloader(BaseDownloader):
     """Download stumpage data from New York DEC."""
@@ -68,13 +157,14 @@ class NewYorkDECDownloader(BaseDownloader):
 
         downloaded = []
 
-        for report_id, path in NY_REPORTS.items():
-            url = f"{NY_BASE_URL}{path}"
-            try:
-                pdf_path = self.download_file(url, f"ny_{report_id}.pdf")
-                downloaded.append(pdf_path)
-            except Exception as e:
-                console.print(f"[yellow]Could not download {report_id}:[/yellow] {e}")
+        report_ids = list(NY_REPORTS)
+        jobs = [(f"{NY_BASE_URL}{NY_REPORTS[rid]}", f"ny_{rid}.pdf") for rid in report_ids]
+
+        for report_id, result in zip(report_ids, self.download_many(jobs)):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {report_id}:[/yellow] {result}")
+            else:
+                downloaded.append(result)
 
         console.print(f"\n[bold green]Downloaded {len(downloaded)} reports[/bold green]")
         return downloaded
@@ -93,7 +183,7 @@ class NewYorkDECDownloader(BaseDownloader):
         results = {}
         for report_id in NY_REPORTS:
             pdf_path = self.download_dir / f"ny_{report_id}.pdf"
-            if pdf_path.exists():
+            if pdf_path.name in self._existing_files:
                 results[report_id] = {
                     "file": pdf_path,
                     "status": "downloaded",
@@ -110,7 +200,11 @@ class NewYorkDECDownloader(BaseDownloader):
 
         for report_id in sorted(NY_REPORTS.keys(), reverse=True):
             pdf_path = self.download_dir / f"ny_{report_id}.pdf"
-            status = "[green]Downloaded[/green]" if pdf_path.exists() else "[dim]Not downloaded[/dim]"
+            status = (
+                "[green]Downloaded[/green]"
+                if pdf_path.name in self._existing_files
+                else "[dim]Not downloaded[/dim]"
+            )
             table.add_row(report_id.replace("_", " ").title(), status)
 
         console.print(table)
@@ -145,45 +239,38 @@ class PennsylvaniaExtensionDownloader(BaseDownloader):
         console.print(f"[bold blue]{'='*60}[/bold blue]\n")
 
         # First, get the archives page to find report URLs
+        # (a conditional GET, so an unchanged archive page is not re-sent)
         console.print("[dim]Fetching report archive...[/dim]")
-        response = self.client.get(PA_ARCHIVES_URL)
-        response.raise_for_status()
-
-        # Save archives page
-        archives_path = self.download_dir / "archives.html"
-        archives_path.write_text(response.text, encoding="utf-8")
+        archives_path = self.download_file(PA_ARCHIVES_URL, "archives.html")
 
         # Parse to find report links
-        soup = BeautifulSoup(response.text, "lxml")
+        tree = _parsed_page(archives_path)
         report_links = []
 
         # Find all links to individual reports
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            text = link.get_text(strip=True).lower()
-            if "timber-market-report" in href and "quarter" in text:
-                full_url = href if href.startswith("http") else f"https://extension.psu.edu{href}"
-                report_links.append((text, full_url))
+        for link in tree.xpath(PA_REPORT_LINKS_XPATH):
+            href = link.get("href")
+            text = link.text_content().strip().lower()
+            full_url = urljoin(PA_ARCHIVES_URL, href)
+            report_links.append((text, full_url))
 
         console.print(f"[dim]Found {len(report_links)} quarterly reports[/dim]")
 
         # Download a sample of recent reports (last 8 quarters = 2 years)
-        downloaded = []
-        for i, (title, url) in enumerate(report_links[:8]):
-            try:
-                response = self.client.get(url)
-                response.raise_for_status()
-
-                # Create filename from title
-                safe_title = title.replace(" ", "_").replace(",", "")[:50]
-                html_path = self.download_dir / f"pa_{safe_title}.html"
-                html_path.write_text(response.text, encoding="utf-8")
-                downloaded.append(html_path)
-                console.print(f"[green]Downloaded:[/green] {title[:60]}...")
+        recent = report_links[:8]
+        jobs = [
+            (url, f"pa_{title.replace(' ', '_').replace(',', '')[:50]}.html")
+            for title, url in recent
+        ]
 
-            except Exception as e:
-                console.print(f"[yellow]Could not download {title[:40]}:[/yellow] {e}")
+        downloaded = []
+        for (title, _), result in zip(recent, self.download_many(jobs)):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {title[:40]}:[/yellow] {result}")
+            else:
+                downloaded.append(result)
 
+        console.print(f"[bold green]Downloaded {len(downloaded)} reports[/bold green]")
         return downloaded
 
     def parse(self) -> dict[str, pd.DataFrame]:
@@ -195,66 +282,29 @@ class PennsylvaniaExtensionDownloader(BaseDownloader):
         console.print("\n[bold]Parsing Pennsylvania reports...[/bold]\n")
 
         results = {}
-        html_files = list(self.download_dir.glob("pa_*.html"))
-
-        for html_path in html_files:
-            if html_path.name == "archives.html":
-                continue
-
-            try:
-                html_content = html_path.read_text(encoding="utf-8")
-                soup = BeautifulSoup(html_content, "lxml")
+        html_files = [f for f in self._list_files("pa_*.html") if f.name != "archives.html"]
 
-                # Find price tables in the HTML
-                tables = soup.find_all("table")
+        # Reports are independent, so parse them on separate cores
+        with ProcessPoolExecutor() as executor:
+            for html_path, tables, error in executor.map(_read_report_tables, html_files):
+                if error:
+                    console.print(f"[yellow]Could not parse {html_path.name}:[/yellow] {error}")
+                    continue
 
-                for i, table in enumerate(tables):
-                    df = self._parse_price_table(table)
-                    if df is not None and not df.empty:
-                        key = f"{html_path.stem}_table{i}"
-                        results[key] = df
-                        console.print(f"[green]Parsed:[/green] {key}")
-
-            except Exception as e:
-                console.print(f"[yellow]Could not parse {html_path.name}:[/yellow] {e}")
+                for i, df in tables:
+                    key = f"{html_path.stem}_table{i}"
+                    results[key] = df
+                    console.print(f"[green]Parsed:[/green] {key}")
 
         return results
 
-    def _parse_price_table(self, table) -> pd.DataFrame | None:
-        """Parse an HTML table into a DataFrame."""
-        rows = table.find_all("tr")
-        if len(rows) < 2:
-            return None
-
-        data = []
-        headers = None
-
-        for row in rows:
-            cells = row.find_all(["th", "td"])
-            cell_texts = [cell.get_text(strip=True) for cell in cells]
-
-            if not any(cell_texts):
-                continue
-
-            if headers is None and any("price" in c.lower() or "species" in c.lower() for c in cell_texts):
-                headers = cell_texts
-                continue
-
-            if headers and len(cell_texts) == len(headers):
-                data.append(cell_texts)
-
-        if not headers or not data:
-            return None
-
-        return pd.DataFrame(data, columns=headers)
-
     def get_summary(self) -> None:
         """Print summary of Pennsylvania data."""
         table = Table(title="Penn State Extension Reports")
         table.add_column("Report", style="cyan")
         table.add_column("Status", style="yellow")
 
-        html_files = list(self.download_dir.glob("pa_*.html"))
+        html_files = self._list_files("pa_*.html")
         html_files = [f for f in html_files if f.name != "archives.html"]
 
         if html_files:
@@ -288,36 +338,31 @@ class VermontFPRDownloader(BaseDownloader):
         console.print(f"[dim]Quarterly stumpage price reports (1981-present)[/dim]")
         console.print(f"[bold blue]{'='*60}[/bold blue]\n")
 
-        # Fetch the main page to find report links
-        response = self.client.get(VT_BASE_URL)
-        response.raise_for_status()
-
-        # Save main page
-        main_path = self.download_dir / "vt_stumpage_main.html"
-        main_path.write_text(response.text, encoding="utf-8")
-        console.print(f"[green]Saved:[/green] {main_path}")
+        # Fetch the main page to find report links (conditional GET, so an
+        # unchanged page is served from disk)
+        main_path = self.download_file(VT_BASE_URL, "vt_stumpage_main.html")
 
         # Parse for PDF links
-        soup = BeautifulSoup(response.text, "lxml")
+        tree = _parsed_page(main_path)
         downloaded = [main_path]
 
         pdf_links = []
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if ".pdf" in href.lower():
-                full_url = href if href.startswith("http") else f"https://fpr.vermont.gov{href}"
-                pdf_links.append((link.get_text(strip=True), full_url))
+        for link in tree.xpath(PDF_LINKS_XPATH):
+            href = link.get("href")
+            full_url = urljoin(VT_BASE_URL, href)
+            pdf_links.append((link.text_content().strip(), full_url))
 
         console.print(f"[dim]Found {len(pdf_links)} PDF links[/dim]")
 
         # Download PDFs (limit to recent ones)
-        for title, url in pdf_links[:12]:  # Last 3 years of quarterly reports
-            try:
-                filename = url.split("/")[-1]
-                pdf_path = self.download_file(url, f"vt_{filename}")
-                downloaded.append(pdf_path)
-            except Exception as e:
-                console.print(f"[yellow]Could not download {title[:40]}:[/yellow] {e}")
+        recent = pdf_links[:12]  # Last 3 years of quarterly reports
+        jobs = [(url, f"vt_{url.split('/')[-1]}") for _, url in recent]
+
+        for (title, _), result in zip(recent, self.download_many(jobs)):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {title[:40]}:[/yellow] {result}")
+            else:
+                downloaded.append(result)
 
         return downloaded
 
@@ -331,7 +376,7 @@ class VermontFPRDownloader(BaseDownloader):
         console.print("[dim]PDF parsing requires manual extraction.[/dim]\n")
 
         results = {}
-        pdf_files = list(self.download_dir.glob("vt_*.pdf"))
+        pdf_files = self._list_files("vt_*.pdf")
 
         for pdf_path in pdf_files:
             results[pdf_path.stem] = {
@@ -348,7 +393,7 @@ class VermontFPRDownloader(BaseDownloader):
         table.add_column("File", style="cyan")
         table.add_column("Status", style="yellow")
 
-        pdf_files = list(self.download_dir.glob("vt_*.pdf"))
+        pdf_files = self._list_files("vt_*.pdf")
 
         if pdf_files:
             for f in sorted(pdf_files)[:10]:
@@ -375,18 +420,20 @@ class NortheastDownloader:
         Returns:
             Dictionary mapping state to list of downloaded files
         """
-        results = {}
-
-        with self.new_york as ny:
-            results["new_york"] = ny.download()
-
-        with self.pennsylvania as pa:
-            results["pennsylvania"] = pa.download()
-
-        with self.vermont as vt:
-            results["vermont"] = vt.download()
+        # The three states are served by different hosts, so run them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "new_york": executor.submit(self._download_state, self.new_york),
+                "pennsylvania": executor.submit(self._download_state, self.pennsylvania),
+                "vermont": executor.submit(self._download_state, self.vermont),
+            }
+            return {state: future.result() for state, future in futures.items()}
 
-        return results
+    @staticmethod
+    def _download_state(downloader: BaseDownloader) -> list[Path]:
+        """Run a single state's download inside its client context."""
+        with downloader as d:
+            return d.download()
 
     def get_summary(self) -> None:
         """Print summary of all Northeast data."""
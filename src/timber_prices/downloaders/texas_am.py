@@ -8,15 +8,20 @@ Data source: https://tfsweb.tamu.edu/timberpricetrends/
 Note: This site uses Cloudflare protection, so we use curl for downloads.
 """
 
+import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
+from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import httpx
+from lxml import html as lxml_html
 from rich.console import Console
 from rich.table import Table
 
-from timber_prices.downloaders.base import BaseDownloader
+from timber_prices.downloaders.base import BaseDownloader, meta_path, read_meta, write_meta
 
 console = Console()
 
@@ -49,6 +54,69 @@ FIVE_YEAR_REPORTS = {
     "2005-2009": "https://tfsweb.tamu.edu/wp-content/uploads/2024/05/Prices2005-2009.pdf",
 }
 
+# Report categories from the main page: (key, label, filename prefix, max files)
+PDF_CATEGORIES = (
+    ("annual", "Annual Reports", "annual", None),
+    ("five_year", "5-Year Reports", "5year", None),
+    ("bimonthly", "Bi-Monthly Reports", "bimonthly", 6),  # Limit to recent reports
+)
+
+# Link classifiers for _discover_pdf_links (applied to lowercased text)
+_MONTH_RE = re.compile(r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)")
+_FIVE_YEAR_HREF_RE = re.compile(r"year|prices20")
+
+# lxml only honours a <meta charset> and otherwise assumes Latin-1 for
+# bytes input, so the page encoding is given explicitly
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# curl settings; the browser user agent gets past Cloudflare's bot check
+CURL_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+CURL_TIMEOUT = 60  # seconds per transfer
+
+
+# Written by curl -w after each transfer: .part path, HTTP status, exit code
+CURL_STATUS_FORMAT = "%{filename_effective}\t%{http_code}\t%{exitcode}\n"
+
+
+def _join_transfers(transfers: list[list[str]]) -> list[str]:
+    """Flatten per-transfer option groups into one curl argument list."""
+    args = []
+    for transfer in transfers:
+        if args:
+            args.append("--next")
+        args += transfer
+    return args
+
+
+def _parse_statuses(output: str, missing_exit_ok: bool = False) -> dict[str, tuple[int, int]]:
+    """Read the per-transfer status lines curl printed with CURL_STATUS_FORMAT.
+
+    Args:
+        output: curl's stdout
+        missing_exit_ok: If True, accept lines without a usable exit code (older
+            curl); the caller supplies it from the process instead
+
+    Returns:
+        Mapping of .part path to (HTTP status, curl exit code)
+    """
+    statuses = {}
+    for line in output.splitlines():
+        fields = line.split("\t")
+        if len(fields) != 3 or not fields[1].isdigit():
+            continue
+        if fields[2].isdigit():
+            statuses[fields[0]] = (int(fields[1]), int(fields[2]))
+        elif missing_exit_ok:
+            statuses[fields[0]] = (int(fields[1]), -1)
+    return statuses
+
+
+def _completed_copy(dest_path: Path) -> bool:
+    """Whether dest_path is exactly what a clean curl transfer left behind."""
+    if not dest_path.exists():
+        return False
+    return read_meta(dest_path).get("size") == dest_path.stat().st_size
+
 
 class TexasAMDownloader(BaseDownloader):
     """Download timber price data from Texas A&M Forest Service.
@@ -65,41 +133,110 @@ class TexasAMDownloader(BaseDownloader):
     def source_id(self) -> str:
         return "texas_am"
 
-    def _curl_download(self, url: str, dest_path: Path) -> bool:
+    def _curl_download(self, url: str, dest_path: Path, if_modified: bool = False) -> bool:
         """Download a file using curl to bypass Cloudflare.
 
         Args:
             url: URL to download
             dest_path: Destination file path
+            if_modified: Only transfer the body if the server's copy is newer
+                than dest_path (the local copy is kept on 304 Not Modified)
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            result = subprocess.run(
-                [
-                    "curl", "-sL",
-                    "-A", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                    "-o", str(dest_path),
-                    url,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-
-            # Check if file was created and has content
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                return True
+        return self._curl_download_many([(url, dest_path)], if_modified=if_modified)[0]
 
-            return False
+    def _curl_download_many(
+        self,
+        jobs: list[tuple[str, Path]],
+        max_parallel: int = 8,
+        if_modified: bool = False,
+    ) -> list[bool]:
+        """Download several files with a single curl process.
+
+        One curl invocation shares its connection pool (and TLS sessions)
+        across all transfers and runs up to max_parallel of them at once,
+        instead of spawning a process and handshaking again for every file.
 
+        Args:
+            jobs: List of (url, destination path) pairs
+            max_parallel: Maximum concurrent transfers
+            if_modified: Send If-Modified-Since for files that already exist,
+                so unchanged files are skipped rather than re-downloaded
+
+        Returns:
+            One success flag per job, in input order
+        """
+        if not jobs:
+            return []
+
+        # One option group per transfer (separated by --next) so each can
+        # carry its own -z time condition. Bodies go to a .part file that is
+        # renamed into place only once curl reports the transfer complete.
+        # -R stamps files with the server's Last-Modified, which the next
+        # run's -z compares against.
+        part_paths = [dest_path.with_name(f"{dest_path.name}.part") for _, dest_path in jobs]
+        transfers = []
+        for (url, dest_path), part_path in zip(jobs, part_paths):
+            args = ["-sL", "-R", "-A", CURL_USER_AGENT, "--max-time", str(CURL_TIMEOUT)]
+            args += ["-w", CURL_STATUS_FORMAT]
+            # Only a copy left by a transfer that finished cleanly may be
+            # kept on 304; older or truncated copies are fetched in full
+            if if_modified and _completed_copy(dest_path):
+                args += ["-z", str(dest_path)]
+            args += ["-o", str(part_path), url]
+            transfers.append(args)
+
+        # (HTTP status, curl exit code) per transfer, keyed by .part path
+        statuses: dict[str, tuple[int, int]] = {}
+        try:
+            if len(jobs) > 1:
+                result = subprocess.run(
+                    ["curl", "--parallel", "--parallel-max", str(max_parallel),
+                     *_join_transfers(transfers)],
+                    capture_output=True,
+                    text=True,
+                    timeout=CURL_TIMEOUT * len(jobs),
+                )
+                statuses = _parse_statuses(result.stdout)
+
+            # curl older than 7.66 rejects --parallel (and older than 7.75
+            # cannot report per-transfer exit codes); run the transfers one
+            # at a time and use each process's exit code instead
+            if not statuses:
+                for args in transfers:
+                    result = subprocess.run(
+                        ["curl", *args],
+                        capture_output=True,
+                        text=True,
+                        timeout=CURL_TIMEOUT,
+                    )
+                    for part, (http_code, _) in _parse_statuses(result.stdout, missing_exit_ok=True).items():
+                        statuses[part] = (http_code, result.returncode)
         except subprocess.TimeoutExpired:
-            console.print(f"[yellow]Timeout downloading {url}[/yellow]")
-            return False
+            console.print(f"[yellow]Timeout downloading {len(jobs)} file(s)[/yellow]")
         except Exception as e:
             console.print(f"[yellow]Error: {e}[/yellow]")
-            return False
+
+        results = []
+        for (url, dest_path), part_path in zip(jobs, part_paths):
+            http_code, exit_code = statuses.get(str(part_path), (0, -1))
+            if exit_code == 0 and http_code == 304 and dest_path.exists():
+                ok = True
+            elif exit_code == 0 and 200 <= http_code < 300 and part_path.exists():
+                os.replace(part_path, dest_path)
+                write_meta(dest_path, {"url": url, "size": dest_path.stat().st_size})
+                ok = True
+            else:
+                # Timed out, cut off (e.g. exit 28 from --max-time) or an
+                # HTTP error page; nothing partial is left behind
+                ok = False
+            part_path.unlink(missing_ok=True)
+            results.append(ok)
+
+        self._invalidate_existing_files()
+        return results
 
     def download(self) -> list[Path]:
         """Download Texas A&M timber price reports.
@@ -122,81 +259,55 @@ class TexasAMDownloader(BaseDownloader):
         # First, save the main page for reference
         console.print("[dim]Fetching main timber trends page...[/dim]")
         main_page = self.download_dir / "timber_trends_main.html"
-        if not self._curl_download(TIMBER_TRENDS_URL, main_page):
+        if not self._curl_download(TIMBER_TRENDS_URL, main_page, if_modified=True):
             console.print("[red]Could not fetch main page - cannot continue[/red]")
             return downloaded
 
         downloaded.append(main_page)
         console.print(f"[green]Saved:[/green] {main_page}")
 
-        # Parse the page for PDF links
-        html_content = main_page.read_text(encoding="utf-8", errors="ignore")
-        pdf_urls = self._discover_pdf_links(html_content)
+        # Parse the page for PDF links, decoding the raw bytes as UTF-8
+        pdf_urls = self._discover_pdf_links(main_page.read_bytes())
 
-        # Download annual reports
-        if pdf_urls["annual"]:
-            console.print(f"\n[bold]Downloading Annual Reports ({len(pdf_urls['annual'])} found)...[/bold]")
-            for url in pdf_urls["annual"]:
-                filename = url.split("/")[-1]
-                pdf_path = self.download_dir / f"annual_{filename}"
-                console.print(f"[blue]Downloading:[/blue] {filename}")
-
-                if self._curl_download(url, pdf_path):
-                    size_kb = pdf_path.stat().st_size / 1024
-                    if size_kb > 1:  # Skip tiny error files
-                        downloaded.append(pdf_path)
-                        console.print(f"[green]Saved:[/green] {pdf_path.name} ({size_kb:.1f} KB)")
-                    else:
-                        pdf_path.unlink()  # Remove error files
-                        console.print(f"[yellow]Skipped (invalid):[/yellow] {filename}")
-
-        # Download 5-year reports
-        if pdf_urls["five_year"]:
-            console.print(f"\n[bold]Downloading 5-Year Reports ({len(pdf_urls['five_year'])} found)...[/bold]")
-            for url in pdf_urls["five_year"]:
-                filename = url.split("/")[-1]
-                pdf_path = self.download_dir / f"5year_{filename}"
-                console.print(f"[blue]Downloading:[/blue] {filename}")
-
-                if self._curl_download(url, pdf_path):
-                    size_kb = pdf_path.stat().st_size / 1024
-                    if size_kb > 1:
-                        downloaded.append(pdf_path)
-                        console.print(f"[green]Saved:[/green] {pdf_path.name} ({size_kb:.1f} KB)")
-                    else:
-                        pdf_path.unlink()
-                        console.print(f"[yellow]Skipped (invalid):[/yellow] {filename}")
-
-        # Download bi-monthly reports (sample)
-        if pdf_urls["bimonthly"]:
-            console.print(f"\n[bold]Downloading Bi-Monthly Reports ({len(pdf_urls['bimonthly'])} found, downloading first 6)...[/bold]")
-            for url in pdf_urls["bimonthly"][:6]:  # Limit to recent reports
+        # Queue annual, 5-year and (recent) bi-monthly reports
+        jobs = []
+        for key, label, prefix, limit in PDF_CATEGORIES:
+            urls = pdf_urls[key]
+            if not urls:
+                continue
+            note = f", downloading first {limit}" if limit and len(urls) > limit else ""
+            console.print(f"[bold]{label} ({len(urls)} found{note})[/bold]")
+            for url in urls[:limit]:
                 filename = url.split("/")[-1]
-                pdf_path = self.download_dir / f"bimonthly_{filename}"
-                console.print(f"[blue]Downloading:[/blue] {filename}")
-
-                if self._curl_download(url, pdf_path):
-                    size_kb = pdf_path.stat().st_size / 1024
-                    if size_kb > 1:
-                        downloaded.append(pdf_path)
-                        console.print(f"[green]Saved:[/green] {pdf_path.name} ({size_kb:.1f} KB)")
-                    else:
-                        pdf_path.unlink()
-                        console.print(f"[yellow]Skipped (invalid):[/yellow] {filename}")
+                jobs.append((url, self.download_dir / f"{prefix}_{filename}"))
+
+        console.print(f"\n[blue]Downloading {len(jobs)} reports...[/blue]")
+        results = self._curl_download_many(jobs, if_modified=True)
+
+        for (url, pdf_path), ok in zip(jobs, results):
+            if not ok:
+                continue
+            if pdf_path.stat().st_size > 1024:  # Skip tiny error files
+                downloaded.append(pdf_path)
+            else:
+                pdf_path.unlink()  # Remove error files
+                meta_path(pdf_path).unlink(missing_ok=True)
+                self._invalidate_existing_files()
+                console.print(f"[yellow]Skipped (invalid):[/yellow] {pdf_path.name}")
 
         console.print(f"\n[bold green]Downloaded {len(downloaded)} files[/bold green]")
         return downloaded
 
-    def _discover_pdf_links(self, html_content: str) -> dict[str, list[str]]:
+    def _discover_pdf_links(self, html_content: bytes) -> dict[str, list[str]]:
         """Discover PDF links from the main page.
 
         Args:
-            html_content: HTML content of the main page
+            html_content: Raw HTML bytes of the main page (UTF-8)
 
         Returns:
             Dictionary with categorized PDF URLs
         """
-        soup = BeautifulSoup(html_content, "lxml")
+        tree = lxml_html.fromstring(html_content, parser=_UTF8_HTML_PARSER)
 
         categories = {
             "annual": [],
@@ -205,19 +316,18 @@ class TexasAMDownloader(BaseDownloader):
             "other": [],
         }
 
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if ".pdf" not in href.lower():
-                continue
+        # Only anchors whose href contains ".pdf" (any case)
+        for link in tree.xpath("//a[contains(translate(@href, 'PDF', 'pdf'), '.pdf')]"):
+            href = link.get("href")
+            full_url = urljoin(TIMBER_TRENDS_URL, href)
+            href_lower = href.lower()
+            text = link.text_content().strip().lower()
 
-            full_url = href if href.startswith("http") else f"{BASE_URL}{href}"
-            text = link.get_text(strip=True).lower()
-
-            if "annual" in text or "annual" in href.lower():
+            if "annual" in text or "annual" in href_lower:
                 categories["annual"].append(full_url)
-            elif "5-year" in text or "year" in href.lower() or "prices20" in href.lower():
+            elif "5-year" in text or _FIVE_YEAR_HREF_RE.search(href_lower):
                 categories["five_year"].append(full_url)
-            elif "ttpt" in href.lower() or any(m in text for m in ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]):
+            elif "ttpt" in href_lower or _MONTH_RE.search(text):
                 categories["bimonthly"].append(full_url)
             else:
                 categories["other"].append(full_url)
@@ -249,29 +359,57 @@ class TexasAMDownloader(BaseDownloader):
             ("November", "December", "NovDec"),
         ]
 
-        downloaded = []
-
+        # Candidate URLs per (year, period), in order of preference
+        candidates = []
         for year in years:
             for month1, month2, abbrev in periods:
-                # Try different URL patterns
                 url_patterns = [
                     f"https://tfsweb.tamu.edu/wp-content/uploads/{year}/TTPT_{year}_{month1}_{month2}.pdf",
                     f"https://tfsweb.tamu.edu/wp-content/uploads/{year + 1}/01/TTPT_{year}_{month1}_{month2}.pdf",
                     f"https://tfsweb.tamu.edu/wp-content/uploads/{year}/05/{abbrev}{year}.pdf",
                 ]
+                candidates.append((f"tx_bimonthly_{year}_{abbrev}.pdf", url_patterns))
+
+        # Published bi-monthly reports do not change, so periods already on
+        # disk are kept as they are and only the missing ones are probed
+        present = self._existing_files
+        downloaded = [
+            self.download_dir / filename for filename, _ in candidates if filename in present
+        ]
+        missing = [(filename, urls) for filename, urls in candidates if filename not in present]
+
+        # Probe every candidate concurrently so misses cost no body
+        probe_urls = [url for _, urls in missing for url in urls]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            exists = dict(zip(probe_urls, executor.map(self._url_exists, probe_urls)))
 
-                for url in url_patterns:
-                    try:
-                        pdf_path = self.download_file(
-                            url, f"tx_bimonthly_{year}_{abbrev}.pdf"
-                        )
-                        downloaded.append(pdf_path)
-                        break
-                    except Exception:
-                        continue
+        jobs = []
+        for filename, urls in missing:
+            url = next((u for u in urls if exists[u]), None)
+            if url is not None:
+                jobs.append((url, filename))
 
+        downloaded.extend(r for r in self.download_many(jobs) if not isinstance(r, Exception))
         return downloaded
 
+    def _url_exists(self, url: str) -> bool:
+        """Check whether a URL resolves.
+
+        Tries a HEAD request first. Cloudflare often refuses HEAD (403/405),
+        so any answer other than 200 or a definite miss is retried as a
+        GET, reading only the status line and headers.
+        """
+        try:
+            status = self.client.head(url).status_code
+            if status == 200:
+                return True
+            if status in (404, 410):
+                return False
+            with self.client.stream("GET", url) as response:
+                return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
     def parse(self) -> dict[str, Any]:
         """Parse Texas A&M PDF reports.
 
@@ -291,7 +429,7 @@ class TexasAMDownloader(BaseDownloader):
         # Catalog annual reports
         for year in ANNUAL_REPORTS:
             pdf_path = self.download_dir / f"tx_annual_{year}.pdf"
-            if pdf_path.exists():
+            if pdf_path.name in self._existing_files:
                 results["annual_reports"][year] = {
                     "file": str(pdf_path),
                     "status": "downloaded",
@@ -302,7 +440,7 @@ class TexasAMDownloader(BaseDownloader):
         for period in FIVE_YEAR_REPORTS:
             safe_period = period.replace("-", "_")
             pdf_path = self.download_dir / f"tx_5year_{safe_period}.pdf"
-            if pdf_path.exists():
+            if pdf_path.name in self._existing_files:
                 results["five_year_reports"][period] = {
                     "file": str(pdf_path),
                     "status": "downloaded",
@@ -319,7 +457,7 @@ class TexasAMDownloader(BaseDownloader):
         table.add_column("Size", style="green")
 
         # Find all downloaded PDFs
-        pdf_files = sorted(self.download_dir.glob("*.pdf"))
+        pdf_files = self._scan_files("*.pdf")
 
         if not pdf_files:
             table.add_row("None", "No files downloaded", "-")
@@ -7,14 +7,25 @@ Data source: https://research.fs.usda.gov/pnw/products/dataandtools/
              production-prices-employment-and-trade-northwest-forest-industries-1958
 """
 
+import importlib.util
+import os
+import shutil
+import struct
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple
 
 import pandas as pd
 from rich.console import Console
 from rich.table import Table
 
-from timber_prices.downloaders.base import BaseDownloader
+from timber_prices.downloaders.base import (
+    CHUNK_SIZE,
+    BaseDownloader,
+    read_parse_stamp,
+    write_parse_stamp,
+)
 
 console = Console()
 
@@ -24,53 +35,156 @@ BASE_URL = "https://research.fs.usda.gov/sites/default/files/2025-07"
 # ZIP archive containing all tables
 ARCHIVE_URL = f"{BASE_URL}/pnw-ppet-tables-1958-2023-excel-latest-version.zip"
 
-# Key stumpage price tables (file names as they appear in the ZIP archive)
+# The Rust-backed calamine reader (``pip install timber-prices[fast-excel]``)
+# parses workbooks far faster than openpyxl; fall back when it is missing.
+EXCEL_ENGINE = (
+    "calamine"
+    if importlib.util.find_spec("python_calamine") is not None
+    and tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2)
+    else "openpyxl"
+)
+
+
+class TableSpec(NamedTuple):
+    """A stumpage price table in the PPET archive."""
+
+    description: str
+    states: tuple[str, ...]
+    file: str  # File name as it appears in the ZIP archive
+
+
+# Key stumpage price tables
 STUMPAGE_TABLES = {
     # Public lands stumpage prices (includes state, county, and federal lands)
-    "table76": {
-        "description": "Stumpage prices on publicly managed lands, Montana and Idaho",
-        "states": ["MT", "ID"],
-        "file": "PPET-Table76.xlsx",
-    },
-    "table84": {
-        "description": "Stumpage prices on publicly managed lands, California",
-        "states": ["CA"],
-        "file": "PPET-Table84.xlsx",
-    },
-    "table90": {
-        "description": "Stumpage prices on publicly managed lands, Washington and Oregon",
-        "states": ["WA", "OR"],
-        "file": "PPET-Table90.xlsx",
-    },
-    "table96": {
-        "description": "Stumpage prices on publicly managed lands, Alaska",
-        "states": ["AK"],
-        "file": "PPET-Table96.xlsx",
-    },
+    "table76": TableSpec(
+        description="Stumpage prices on publicly managed lands, Montana and Idaho",
+        states=("MT", "ID"),
+        file="PPET-Table76.xlsx",
+    ),
+    "table84": TableSpec(
+        description="Stumpage prices on publicly managed lands, California",
+        states=("CA",),
+        file="PPET-Table84.xlsx",
+    ),
+    "table90": TableSpec(
+        description="Stumpage prices on publicly managed lands, Washington and Oregon",
+        states=("WA", "OR"),
+        file="PPET-Table90.xlsx",
+    ),
+    "table96": TableSpec(
+        description="Stumpage prices on publicly managed lands, Alaska",
+        states=("AK",),
+        file="PPET-Table96.xlsx",
+    ),
     # National Forest stumpage prices by species
-    "table78": {
-        "description": "NF stumpage prices by species, Northern Region (MT/ID)",
-        "states": ["MT", "ID"],
-        "file": "PPET-Table78.xlsx",
-    },
-    "table81": {
-        "description": "NF stumpage prices by species, Intermountain Region",
-        "states": ["NV", "UT", "WY", "CO", "ID"],
-        "file": "PPET-Table81.xlsx",
-    },
-    "table86": {
-        "description": "NF stumpage prices by species, Pacific Southwest (CA)",
-        "states": ["CA"],
-        "file": "PPET-Table86.xlsx",
-    },
-    "table92": {
-        "description": "NF stumpage prices by species, Pacific Northwest (WA/OR)",
-        "states": ["WA", "OR"],
-        "file": "PPET-Table92.xlsx",
-    },
+    "table78": TableSpec(
+        description="NF stumpage prices by species, Northern Region (MT/ID)",
+        states=("MT", "ID"),
+        file="PPET-Table78.xlsx",
+    ),
+    "table81": TableSpec(
+        description="NF stumpage prices by species, Intermountain Region",
+        states=("NV", "UT", "WY", "CO", "ID"),
+        file="PPET-Table81.xlsx",
+    ),
+    "table86": TableSpec(
+        description="NF stumpage prices by species, Pacific Southwest (CA)",
+        states=("CA",),
+        file="PPET-Table86.xlsx",
+    ),
+    "table92": TableSpec(
+        description="NF stumpage prices by species, Pacific Northwest (WA/OR)",
+        states=("WA", "OR"),
+        file="PPET-Table92.xlsx",
+    ),
 }
 
 
+def _copy_stored_member(zip_path: Path, info: zipfile.ZipInfo, dest_path: Path) -> bool:
+    """Copy an uncompressed member's bytes in-kernel with copy_file_range.
+
+    Returns:
+        True if copied, False if the caller should fall back to zipfile
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(zip_path, "rb") as src, open(dest_path, "wb") as dst:
+        # The data follows the 30-byte local header, its file name and its
+        # extra field (whose length can differ from the central directory's)
+        src.seek(info.header_offset)
+        name_len, extra_len = struct.unpack("<HH", src.read(30)[26:30])
+        offset = info.header_offset + 30 + name_len + extra_len
+        remaining = info.file_size
+        try:
+            while remaining:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining, offset)
+                if copied == 0:
+                    return False
+                offset += copied
+                remaining -= copied
+        except OSError:
+            # e.g. unsupported by the filesystem or an older kernel
+            return False
+    return True
+
+
+def _extract_member(zip_path: Path, member: str, dest_path: Path) -> Path:
+    """Extract one archive member to dest_path.
+
+    Opens its own ZipFile handle, since a shared handle is not safe to
+    read from several threads at once.
+    """
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        info = zf.getinfo(member)
+        # Stored (uncompressed, unencrypted) members need no inflating, so
+        # let the kernel copy them without passing through user space
+        if (
+            info.compress_type == zipfile.ZIP_STORED
+            and not info.flag_bits & 0x1
+            and _copy_stored_member(zip_path, info, dest_path)
+        ):
+            return dest_path
+
+        # Inflate in fixed-size chunks rather than holding the whole member
+        # in memory
+        with zf.open(info) as src, open(dest_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=CHUNK_SIZE)
+    return dest_path
+
+
+def _cache_path(cache_dir: Path, table_id: str) -> Path:
+    """Pickled raw DataFrame for a table."""
+    return cache_dir / f"{table_id}.pkl"
+
+
+def _read_workbook(
+    file_path: Path, table_id: str, cache_dir: Path
+) -> tuple[str, pd.DataFrame | None, str | None]:
+    """Read one PPET workbook and cache its raw DataFrame.
+
+    Defined at module level so it can be pickled into worker processes.
+
+    Args:
+        file_path: Workbook to read
+        table_id: Table the workbook holds
+        cache_dir: Directory for the pickled raw DataFrames
+
+    Returns:
+        Tuple of (table ID, raw DataFrame or None, error message or None)
+    """
+    try:
+        # Read the Excel file - may need to skip header rows
+        df = pd.read_excel(file_path, header=None, engine=EXCEL_ENGINE)
+    except Exception as e:
+        return table_id, None, str(e)
+
+    # Raw sheets mix title text and numbers in every column, which Arrow
+    # cannot type, so the cache is a pickle rather than Parquet
+    df.to_pickle(_cache_path(cache_dir, table_id))
+    write_parse_stamp(file_path, [table_id])
+    return table_id, df, None
+
+
 class USFSPNWDownloader(BaseDownloader):
     """Download stumpage data from USFS Pacific Northwest Research Station."""
 
@@ -96,32 +210,46 @@ class USFSPNWDownloader(BaseDownloader):
         # Download the ZIP archive
         zip_path = self.download_file(ARCHIVE_URL, "ppet-tables-excel.zip")
 
-        # Extract stumpage price tables
-        extracted_files = []
+        # Find the stumpage price tables in the archive
+        members = {}
         with zipfile.ZipFile(zip_path, "r") as zf:
             all_files = zf.namelist()
             console.print(f"[dim]Archive contains {len(all_files)} files[/dim]")
 
-            # Extract only stumpage-related tables
-            for table_id, table_info in STUMPAGE_TABLES.items():
-                target_file = table_info["file"]
-                matching = [f for f in all_files if f.endswith(target_file)]
-
-                if matching:
-                    source_path = matching[0]
-                    dest_path = self.download_dir / target_file
+            # Index members by base name once (the first occurrence wins)
+            by_name = {}
+            for name in all_files:
+                by_name.setdefault(name.rsplit("/", 1)[-1], name)
 
-                    with zf.open(source_path) as src, open(dest_path, "wb") as dst:
-                        dst.write(src.read())
+            for table_id, table_info in STUMPAGE_TABLES.items():
+                target_file = table_info.file
+                member = by_name.get(target_file)
 
-                    extracted_files.append(dest_path)
-                    console.print(
-                        f"[green]Extracted:[/green] {target_file} "
-                        f"[dim]({table_info['description']})[/dim]"
-                    )
+                if member:
+                    members[table_id] = member
                 else:
                     console.print(f"[yellow]Not found:[/yellow] {target_file}")
 
+        # Extract them concurrently; zlib releases the GIL while inflating
+        extracted_files = []
+        with ThreadPoolExecutor(max_workers=max(len(members), 1)) as executor:
+            futures = {
+                table_id: executor.submit(
+                    _extract_member,
+                    zip_path,
+                    member,
+                    self.download_dir / STUMPAGE_TABLES[table_id].file,
+                )
+                for table_id, member in members.items()
+            }
+            for table_id, future in futures.items():
+                table_info = STUMPAGE_TABLES[table_id]
+                extracted_files.append(future.result())
+                console.print(
+                    f"[green]Extracted:[/green] {table_info.file} [dim]({table_info.description})[/dim]"
+                )
+
+        self._invalidate_existing_files()
         console.print(f"\n[bold green]Extracted {len(extracted_files)} stumpage tables[/bold green]")
         return extracted_files
 
@@ -133,33 +261,68 @@ class USFSPNWDownloader(BaseDownloader):
         """
         console.print("\n[bold]Parsing stumpage price tables...[/bold]\n")
 
-        results = {}
+        paths = {}
         for table_id, table_info in STUMPAGE_TABLES.items():
-            file_path = self.download_dir / table_info["file"]
+            file_path = self.download_dir / table_info.file
 
             if not file_path.exists():
                 console.print(f"[yellow]Skipping {table_id}: file not found[/yellow]")
                 continue
-
+            paths[table_id] = file_path
+
+        # Reuse the cached DataFrames for workbooks unchanged since the last
+        # parse; an unreadable cache (truncated, or written by another pandas
+        # version) sends the workbook back to be parsed
+        cache_dir = self.cache_dir
+        frames = {}
+        pending = {}
+        for table_id, file_path in paths.items():
+            cached = read_parse_stamp(file_path)
+            if cached is None or table_id not in cached:
+                pending[table_id] = file_path
+                continue
             try:
-                # Read the Excel file - may need to skip header rows
-                df = pd.read_excel(file_path, header=None)
-
-                # Store raw data for now - specific parsing logic will vary by table
-                results[table_id] = {
-                    "raw_df": df,
-                    "file": file_path,
-                    "states": table_info["states"],
-                    "description": table_info["description"],
-                }
+                df = pd.read_pickle(_cache_path(cache_dir, table_id))
+            except Exception:
+                pending[table_id] = file_path
+                continue
+            frames[table_id] = df
+            console.print(
+                f"[green]Loaded:[/green] {table_id} - "
+                f"{df.shape[0]} rows x {df.shape[1]} cols [dim](cached)[/dim]"
+            )
 
-                console.print(
-                    f"[green]Parsed:[/green] {table_id} - "
-                    f"{df.shape[0]} rows x {df.shape[1]} cols"
-                )
+        # Workbooks are independent and parsing is CPU-bound, so read them
+        # on separate cores
+        if pending:
+            with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+                futures = [
+                    executor.submit(_read_workbook, file_path, table_id, cache_dir)
+                    for table_id, file_path in pending.items()
+                ]
+                for future in as_completed(futures):
+                    table_id, df, error = future.result()
+                    if error is not None:
+                        console.print(f"[red]Error parsing {table_id}:[/red] {error}")
+                        continue
+                    frames[table_id] = df
+                    console.print(
+                        f"[green]Parsed:[/green] {table_id} - "
+                        f"{df.shape[0]} rows x {df.shape[1]} cols"
+                    )
 
-            except Exception as e:
-                console.print(f"[red]Error parsing {table_id}:[/red] {e}")
+        # Store raw data for now - specific parsing logic will vary by table
+        results = {}
+        for table_id, file_path in paths.items():
+            if table_id not in frames:
+                continue
+            table_info = STUMPAGE_TABLES[table_id]
+            results[table_id] = {
+                "raw_df": frames[table_id],
+                "file": file_path,
+                "states": list(table_info.states),
+                "description": table_info.description,
+            }
 
         return results
 
@@ -172,13 +335,13 @@ class USFSPNWDownloader(BaseDownloader):
         table.add_column("Status", style="yellow")
 
         for table_id, table_info in STUMPAGE_TABLES.items():
-            file_path = self.download_dir / table_info["file"]
+            file_path = self.download_dir / table_info.file
             status = "[green]Downloaded[/green]" if file_path.exists() else "[dim]Not downloaded[/dim]"
 
             table.add_row(
                 table_id,
-                table_info["description"],
-                ", ".join(table_info["states"]),
+                table_info.description,
+                ", ".join(table_info.states),
                 status,
             )
 
@@ -13,7 +13,12 @@ from typing import Any
 from rich.console import Console
 from rich.table import Table
 
-from timber_prices.downloaders.base import BaseDownloader
+from timber_prices.downloaders.base import (
+    PDF_CONTENT_TYPES,
+    BaseDownloader,
+    InvalidContentError,
+    looks_like_pdf,
+)
 
 console = Console()
 
@@ -32,6 +37,9 @@ ANNUAL_REPORTS = {
     2012: "https://wvforestry.com/pdf/STUMPAGE%20REPORT%202012.pdf",
 }
 
+# Report years, newest first
+_YEARS_DESC = tuple(sorted(ANNUAL_REPORTS, reverse=True))
+
 
 class WestVirginiaForestryDownloader(BaseDownloader):
     """Download timber price data from WV Division of Forestry.
@@ -80,38 +88,40 @@ class WestVirginiaForestryDownloader(BaseDownloader):
 
         # Determine which years to download
         if years is None:
-            years = sorted(ANNUAL_REPORTS.keys(), reverse=True)
-
-        downloaded = []
-        failed = []
+            years = _YEARS_DESC
 
+        # Build the full job list up front, then fetch concurrently
+        years_wanted = []
+        jobs = []
         for year in years:
             if year not in ANNUAL_REPORTS:
                 console.print(f"[yellow]No report available for {year}[/yellow]")
                 continue
+            years_wanted.append(year)
+            jobs.append((ANNUAL_REPORTS[year], f"wv_timber_{year}.pdf"))
 
-            url = ANNUAL_REPORTS[year]
-            local_filename = f"wv_timber_{year}.pdf"
-
-            try:
-                pdf_path = self.download_file(url, local_filename)
-
-                # Verify it's a valid PDF
-                size_kb = pdf_path.stat().st_size / 1024
-
-                with open(pdf_path, "rb") as f:
-                    header = f.read(4)
-
-                if header == b"%PDF" and size_kb > 5:
-                    downloaded.append(pdf_path)
-                else:
-                    console.print(f"[yellow]Invalid file for {year} (not a PDF)[/yellow]")
-                    pdf_path.unlink()
-                    failed.append(year)
+        downloaded = []
+        failed = []
 
-            except Exception as e:
-                console.print(f"[yellow]Could not download {year}:[/yellow] {e}")
+        # Error pages are rejected by size, type or their first bytes before
+        # anything is written, so nothing is read back from disk. Every report
+        # is on wvforestry.com, so keep at most four requests in flight
+        results = self.download_many(
+            jobs,
+            max_workers=4,
+            min_size=5 * 1024,
+            validate=looks_like_pdf,
+            content_types=PDF_CONTENT_TYPES,
+        )
+        for year, result in zip(years_wanted, results):
+            if isinstance(result, InvalidContentError):
+                console.print(f"[yellow]Invalid file for {year} (not a PDF)[/yellow]")
+                failed.append(year)
+            elif isinstance(result, Exception):
+                console.print(f"[yellow]Could not download {year}:[/yellow] {result}")
                 failed.append(year)
+            else:
+                downloaded.append(result)
 
         console.print(f"\n[bold green]Downloaded {len(downloaded)} annual reports[/bold green]")
         if failed:
@@ -128,7 +138,7 @@ class WestVirginiaForestryDownloader(BaseDownloader):
         Returns:
             List of paths to downloaded files
         """
-        recent_years = sorted(ANNUAL_REPORTS.keys(), reverse=True)[:num_years]
+        recent_years = list(_YEARS_DESC[:num_years])
         return self.download(years=recent_years)
 
     def parse(self) -> dict[str, Any]:
@@ -143,16 +153,18 @@ class WestVirginiaForestryDownloader(BaseDownloader):
         console.print("[dim]PDF parsing requires pdfplumber or similar tools.[/dim]")
         console.print("[dim]Data contains annual stumpage prices by tax region.[/dim]\n")
 
+        # One directory read; each entry carries its own stat()
+        pdf_files = {entry.name: entry for entry in self._scan_files("wv_timber_*.pdf")}
+
         results = {}
         for year in ANNUAL_REPORTS:
-            pdf_path = self.download_dir / f"wv_timber_{year}.pdf"
-            if pdf_path.exists():
-                size_kb = pdf_path.stat().st_size / 1024
+            entry = pdf_files.get(f"wv_timber_{year}.pdf")
+            if entry is not None:
                 results[year] = {
-                    "file": str(pdf_path),
+                    "file": entry.path,
                     "status": "downloaded",
                     "format": "PDF",
-                    "size_kb": round(size_kb, 1),
+                    "size_kb": round(entry.stat().st_size / 1024, 1),
                 }
 
         return results
@@ -164,10 +176,12 @@ class WestVirginiaForestryDownloader(BaseDownloader):
         table.add_column("Status", style="yellow")
         table.add_column("Size", style="green")
 
-        for year in sorted(ANNUAL_REPORTS.keys(), reverse=True):
-            pdf_path = self.download_dir / f"wv_timber_{year}.pdf"
-            if pdf_path.exists():
-                size_kb = pdf_path.stat().st_size / 1024
+        pdf_files = {entry.name: entry for entry in self._scan_files("wv_timber_*.pdf")}
+
+        for year in _YEARS_DESC:
+            entry = pdf_files.get(f"wv_timber_{year}.pdf")
+            if entry is not None:
+                size_kb = entry.stat().st_size / 1024
                 status = "[green]Downloaded[/green]"
                 size = f"{size_kb:.1f} KB"
             else:
@@ -179,7 +193,7 @@ class WestVirginiaForestryDownloader(BaseDownloader):
 
         # Count totals
         total_available = len(ANNUAL_REPORTS)
-        total_downloaded = len(list(self.download_dir.glob("wv_timber_*.pdf")))
+        total_downloaded = len(pdf_files)
         console.print(f"\n[dim]Total available: {total_available} annual reports[/dim]")
         console.print(f"[dim]Downloaded: {total_downloaded} reports[/dim]")
 
@@ -11,10 +11,30 @@ console = Console()
 
 # Read the parsed data
 csv_path = Path("/Users/mihiarc/landuse-model/forest-rents/data/raw/ky_forestry/ky_stumpage_parsed.csv")
-df = pd.read_csv(csv_path)
+# Only the columns summarized below; low-cardinality text as categoricals
+columns = ['year', 'quarter', 'region', 'species', 'product_type', 'grade', 'price_avg', 'unit']
+dtypes = {
+    'year': 'int16',
+    'quarter': 'int8',
+    'region': 'category',
+    'species': 'category',
+    'product_type': 'category',
+    'grade': 'category',
+    'price_avg': 'float32',
+    'unit': 'category',
+}
+
+# Prefer the typed Parquet copy written alongside the CSV, unless the CSV
+# has been rewritten since; otherwise the pyarrow engine parses the CSV on
+# all cores
+parquet_path = csv_path.with_suffix('.parquet')
+if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+    data_path, df = parquet_path, pd.read_parquet(parquet_path, columns=columns).astype(dtypes)
+else:
+    data_path, df = csv_path, pd.read_csv(csv_path, engine='pyarrow', usecols=columns, dtype=dtypes)
 
 console.print("\n[bold cyan]Kentucky Delivered Log Price Data Summary[/bold cyan]\n")
-console.print(f"[dim]Data file: {csv_path}[/dim]\n")
+console.print(f"[dim]Data file: {data_path}[/dim]\n")
 
 # Overall statistics
 console.print("[bold]Dataset Overview:[/bold]\n")
@@ -23,7 +43,7 @@ overview.add_column("Metric", style="cyan")
 overview.add_column("Value", style="green")
 
 overview.add_row("Total Records", f"{len(df):,}")
-overview.add_row("File Size", f"{csv_path.stat().st_size / 1024:.1f} KB")
+overview.add_row("File Size", f"{data_path.stat().st_size / 1024:.1f} KB")
 overview.add_row("Date Range", f"{df['year'].min()}-Q{df['quarter'].min()} to {df['year'].max()}-Q{df['quarter'].max()}")
 overview.add_row("Unique Years", str(df['year'].nunique()))
 overview.add_row("Unique Quarters", str(df['quarter'].nunique()))
@@ -44,13 +64,19 @@ yq_table.add_column("Records", justify="right", style="green")
 yq_table.add_column("Regions", justify="right", style="blue")
 yq_table.add_column("Species", justify="right", style="magenta")
 
-for (year, quarter), group in df.groupby(['year', 'quarter']):
+yq_stats = df.groupby(['year', 'quarter'], observed=True).agg(
+    records=('region', 'size'),
+    regions=('region', 'nunique'),
+    species=('species', 'nunique'),
+)
+for stats in yq_stats.itertuples():
+    year, quarter = stats.Index
     yq_table.add_row(
         str(year),
         f"Q{quarter}",
-        f"{len(group):,}",
-        str(group['region'].nunique()),
-        str(group['species'].nunique())
+        f"{stats.records:,}",
+        str(stats.regions),
+        str(stats.species)
     )
 
 console.print(yq_table)
@@ -65,16 +91,19 @@ species_table.add_column("Records", justify="right", style="green")
 species_table.add_column("Avg Price ($/MBF)", justify="right", style="yellow")
 species_table.add_column("Max Price ($/MBF)", justify="right", style="red")
 
-for rank, (species, count) in enumerate(df['species'].value_counts().items(), 1):
-    species_df = df[df['species'] == species]
-    avg_price = species_df['price_avg'].mean()
-    max_price = species_df['price_avg'].max()
+# One grouped pass instead of a boolean mask per species
+species_stats = (
+    df.groupby('species', observed=True)['price_avg']
+    .agg(['size', 'mean', 'max'])
+    .sort_values('size', ascending=False, kind='stable')
+)
+for rank, stats in enumerate(species_stats.itertuples(), 1):
     species_table.add_row(
         str(rank),
-        species,
-        f"{count:,}",
-        f"${avg_price:.0f}",
-        f"${max_price:.0f}"
+        stats.Index,
+        f"{stats.size:,}",
+        f"${stats.mean:.0f}",
+        f"${stats.max:.0f}"
     )
 
 console.print(species_table)
@@ -89,16 +118,15 @@ product_table.add_column("Records", justify="right", style="green")
 product_table.add_column("Avg Price", justify="right", style="blue")
 product_table.add_column("Price Range", style="magenta")
 
-for (product, grade), group in df.groupby(['product_type', 'grade']):
-    avg_price = group['price_avg'].mean()
-    min_price = group['price_avg'].min()
-    max_price = group['price_avg'].max()
+product_stats = df.groupby(['product_type', 'grade'], observed=True)['price_avg'].agg(['size', 'mean', 'min', 'max'])
+for stats in product_stats.itertuples():
+    product, grade = stats.Index
     product_table.add_row(
         product,
         grade,
-        f"{len(group):,}",
-        f"${avg_price:.0f}",
-        f"${min_price:.0f} - ${max_price:.0f}"
+        f"{stats.size:,}",
+        f"${stats.mean:.0f}",
+        f"${stats.min:.0f} - ${stats.max:.0f}"
     )
 
 console.print(product_table)
@@ -113,18 +141,20 @@ region_table.add_column("Species Count", justify="right", style="yellow")
 region_table.add_column("Avg Price ($/MBF)", justify="right", style="blue")
 region_table.add_column("Price Range", style="magenta")
 
-for region in sorted(df['region'].unique()):
-    region_df = df[df['region'] == region]
-    avg_price = region_df['price_avg'].mean()
-    min_price = region_df['price_avg'].min()
-    max_price = region_df['price_avg'].max()
-    species_count = region_df['species'].nunique()
+region_stats = df.groupby('region', observed=True).agg(
+    records=('price_avg', 'size'),
+    species_count=('species', 'nunique'),
+    avg_price=('price_avg', 'mean'),
+    min_price=('price_avg', 'min'),
+    max_price=('price_avg', 'max'),
+)
+for stats in region_stats.itertuples():
     region_table.add_row(
-        region,
-        f"{len(region_df):,}",
-        str(species_count),
-        f"${avg_price:.0f}",
-        f"${min_price:.0f} - ${max_price:.0f}"
+        stats.Index,
+        f"{stats.records:,}",
+        str(stats.species_count),
+        f"${stats.avg_price:.0f}",
+        f"${stats.min_price:.0f} - ${stats.max_price:.0f}"
     )
 
 console.print(region_table)
@@ -141,7 +171,7 @@ high_value.add_column("Region", style="magenta")
 high_value.add_column("Unit", style="dim")
 
 # Get top prices
-top_prices = df.groupby(['species', 'product_type', 'grade', 'region', 'unit'])['price_avg'].mean()
+top_prices = df.groupby(['species', 'product_type', 'grade', 'region', 'unit'], observed=True)['price_avg'].mean()
 top_prices = top_prices.sort_values(ascending=False).head(10)
 
 for (species, product, grade, region, unit), price in top_prices.items():
@@ -162,16 +192,16 @@ sample.add_column("Grade", style="cyan", width=6)
 sample.add_column("Price", justify="right", style="green", width=8)
 sample.add_column("Unit", style="dim", width=6)
 
-for _, row in df.head(10).iterrows():
+for row in df.head(10).itertuples(index=False):
     sample.add_row(
-        str(row['year']),
-        f"Q{row['quarter']}",
-        row['region'],
-        row['species'],
-        row['product_type'],
-        row['grade'],
-        f"${row['price_avg']:.0f}",
-        row['unit']
+        str(row.year),
+        f"Q{row.quarter}",
+        row.region,
+        row.species,
+        row.product_type,
+        row.grade,
+        f"${row.price_avg:.0f}",
+        row.unit
     )
 
 console.print(sample)
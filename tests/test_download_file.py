@@ -0,0 +1,169 @@
+"""Tests for BaseDownloader.download_file against a mocked HTTP transport."""
+
+import hashlib
+import json
+
+import httpx
+import pytest
+
+from timber_prices.downloaders import base
+from timber_prices.downloaders.base import (
+    PDF_CONTENT_TYPES,
+    BaseDownloader,
+    InvalidContentError,
+    looks_like_pdf,
+)
+
+URL = "https://example.org/report.pdf"
+BODY = b"%PDF-1.7\n" + bytes(range(256)) * 40
+
+
+class _Downloader(BaseDownloader):
+    source_name = "Test source"
+    source_id = "test"
+
+    def download(self):
+        return []
+
+    def parse(self):
+        return {}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(base.time, "sleep", delays.append)
+    return delays
+
+
+@pytest.fixture
+def make_downloader(tmp_path):
+    """Build a downloader that writes to tmp_path and serves from a handler."""
+
+    def make(handler):
+        downloader = _Downloader()
+        downloader.client = httpx.Client(transport=httpx.MockTransport(handler))
+        downloader.__dict__["download_dir"] = tmp_path
+        return downloader
+
+    return make
+
+
+def _pdf_response(body=BODY, **headers):
+    return httpx.Response(
+        200, headers={"content-type": "application/pdf", **headers}, content=body
+    )
+
+
+def test_not_modified_keeps_local_file(make_downloader, tmp_path):
+    dest = tmp_path / "report.pdf"
+    dest.write_bytes(BODY)
+    (tmp_path / "report.pdf.meta.json").write_text(json.dumps({"url": URL, "etag": '"v1"'}))
+
+    def handler(request):
+        assert request.headers["if-none-match"] == '"v1"'
+        return httpx.Response(304)
+
+    path = make_downloader(handler).download_file(URL, "report.pdf", show_progress=False)
+
+    assert path == dest
+    assert dest.read_bytes() == BODY
+
+
+def test_interrupted_transfer_is_resumed(make_downloader, tmp_path):
+    offset = len(BODY) // 2
+    (tmp_path / "report.pdf.part").write_bytes(BODY[:offset])
+    (tmp_path / "report.pdf.part.meta.json").write_text(json.dumps({"if_range": '"v1"'}))
+
+    def handler(request):
+        assert request.headers["range"] == f"bytes={offset}-"
+        assert request.headers["if-range"] == '"v1"'
+        return httpx.Response(
+            206,
+            headers={
+                "content-type": "application/pdf",
+                "content-range": f"bytes {offset}-{len(BODY) - 1}/{len(BODY)}",
+                "etag": '"v1"',
+            },
+            content=BODY[offset:],
+        )
+
+    path = make_downloader(handler).download_file(URL, "report.pdf", show_progress=False)
+
+    assert path.read_bytes() == BODY
+    assert not (tmp_path / "report.pdf.part").exists()
+    meta = json.loads((tmp_path / "report.pdf.meta.json").read_text())
+    assert meta["sha256"] == hashlib.sha256(BODY).hexdigest()
+
+
+def test_changed_file_of_same_size_is_replaced(make_downloader, tmp_path):
+    old_body = BODY[:-4] + b"v1\n\n"
+    dest = tmp_path / "report.pdf"
+    dest.write_bytes(old_body)
+    (tmp_path / "report.pdf.meta.json").write_text(
+        json.dumps({"url": URL, "sha256": hashlib.sha256(old_body).hexdigest()})
+    )
+
+    def handler(request):
+        # No validators were recorded, so the copy is revalidated by mtime
+        assert "if-modified-since" in request.headers
+        return _pdf_response()
+
+    path = make_downloader(handler).download_file(URL, "report.pdf", show_progress=False)
+
+    assert path.read_bytes() == BODY
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        # Undersized error page
+        httpx.Response(200, headers={"content-type": "text/html"}, content=b"x" * 100),
+        # Large enough, but not a PDF by its declared type
+        httpx.Response(200, headers={"content-type": "text/html"}, content=b"x" * 8192),
+        # Generic binary type, but not a PDF by its first bytes
+        httpx.Response(
+            200, headers={"content-type": "application/octet-stream"}, content=b"<html>" * 2048
+        ),
+    ],
+    ids=["undersized", "wrong-type", "wrong-content"],
+)
+def test_invalid_response_is_rejected(make_downloader, tmp_path, response):
+    dest = tmp_path / "report.pdf"
+    dest.write_bytes(BODY)
+    downloader = make_downloader(lambda request: response)
+
+    with pytest.raises(InvalidContentError):
+        downloader.download_file(
+            URL,
+            "report.pdf",
+            show_progress=False,
+            min_size=5 * 1024,
+            validate=looks_like_pdf,
+            content_types=PDF_CONTENT_TYPES,
+        )
+
+    # The earlier copy is left as it was and nothing partial remains
+    assert dest.read_bytes() == BODY
+    assert not (tmp_path / "report.pdf.part").exists()
+
+
+def test_retry_after_is_honoured(make_downloader, tmp_path, sleeps):
+    responses = iter([httpx.Response(503, headers={"retry-after": "2"}), _pdf_response()])
+
+    path = make_downloader(lambda request: next(responses)).download_file(
+        URL, "report.pdf", show_progress=False
+    )
+
+    assert sleeps == [2.0]
+    assert path.read_bytes() == BODY
+
+
+def test_client_error_is_not_retried(make_downloader, sleeps):
+    downloader = make_downloader(lambda request: httpx.Response(404))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        downloader.download_file(URL, "report.pdf", show_progress=False)
+
+    assert sleeps == []